@@ -19,6 +19,9 @@ class ConfluenceClient:
     _instance = None
     _lock = threading.Lock()
 
+    # Seconds before the title index is reloaded to pick up pages changed by others
+    TITLE_INDEX_TTL = 60.0
+
     @classmethod
     def get_instance(
         cls: type["ConfluenceClient"],
@@ -102,9 +105,30 @@ class ConfluenceClient:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        # Reuse TCP/TLS connections across direct requests instead of reconnecting each
+        # time; requests.Session is not thread-safe, so each thread gets its own
+        self._thread_local = threading.local()
+
+        # Page titles in the space, loaded on the first conflict check and kept
+        # current by create_page, update_page and delete_page
+        self._title_index: Optional[Dict[str, str]] = None
+        self._title_index_loaded_at = 0.0
+        self._index_lock = threading.Lock()
 
         logger.info(f"Initialized Confluence client for space: {space_key}")
 
+    @property
+    def _session(self: "ConfluenceClient") -> requests.Session:
+        """HTTP session for direct requests made from the calling thread.
+
+        Returns:
+            The calling thread's session, created on first use
+        """
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._thread_local.session = requests.Session()
+        return session
+
     def _retry_with_backoff(
         self: "ConfluenceClient", operation: callable, *args: Any, **kwargs: Any
     ) -> Any:
@@ -171,7 +195,7 @@ class ConfluenceClient:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         logger.debug(f"Making {method} request to {url}")
 
-        response = requests.request(
+        response = self._session.request(
             method=method, url=url, headers=self.headers, json=data, verify=True
         )
 
@@ -219,16 +243,7 @@ class ConfluenceClient:
         result = self._retry_with_backoff(
             self._make_direct_request, "POST", "rest/api/content/", create_params
         )
-
-        # After successful page creation, get and log all pages in the space
-        try:
-            all_pages = self.list_all_space_pages()
-            page_titles = [page.get("title", "Unknown") for page in all_pages]
-            logger.info(
-                f"Pages in space {self.space_key!r} after creating {title!r}: {page_titles}"
-            )
-        except Exception as e:
-            logger.warning(f"Failed to retrieve pages list after creating '{title!r}': {e}")
+        self._index_title(result.get("id"), title)
 
         return result
 
@@ -270,9 +285,12 @@ class ConfluenceClient:
             "version": {"number": version + 1},
         }
 
-        return self._retry_with_backoff(
+        result = self._retry_with_backoff(
             self._make_direct_request, "PUT", f"rest/api/content/{page_id}", update_params
         )
+        self._index_title(page_id, title)
+
+        return result
 
     def delete_page(self: "ConfluenceClient", page_id: str) -> None:
         """Delete a page from Confluence.
@@ -282,6 +300,7 @@ class ConfluenceClient:
         """
         logger.info(f"Deleting page with ID: {page_id}")
         self._retry_with_backoff(self.client.remove_page, page_id=page_id)
+        self._index_title(page_id, None)
 
     def get_page(self: "ConfluenceClient", page_id: str) -> Dict[str, Any]:
         """Get a page from Confluence by its ID.
@@ -425,7 +444,7 @@ class ConfluenceClient:
 
             with open(file_path, "rb") as f:
                 files = {"file": (filename, f, "application/octet-stream")}
-                response = requests.post(url, headers=headers, files=files, verify=True)
+                response = self._session.post(url, headers=headers, files=files, verify=True)
 
             if response.ok:
                 logger.info(f"Successfully uploaded attachment: {filename}")
@@ -456,7 +475,7 @@ class ConfluenceClient:
         try:
             # Get existing attachments
             url = f"{self.base_url}/rest/api/content/{page_id}/child/attachment"
-            response = requests.get(url, headers=self.headers, verify=True)
+            response = self._session.get(url, headers=self.headers, verify=True)
 
             if response.ok:
                 attachments = response.json().get("results", [])
@@ -464,7 +483,7 @@ class ConfluenceClient:
                     if attachment.get("title") == filename:
                         attachment_id = attachment.get("id")
                         delete_url = f"{self.base_url}/rest/api/content/{attachment_id}"
-                        delete_response = requests.delete(
+                        delete_response = self._session.delete(
                             delete_url, headers=self.headers, verify=True
                         )
                         if delete_response.ok:
@@ -493,9 +512,46 @@ class ConfluenceClient:
         logger.info(f"Found {len(title_to_id)} pages in space {self.space_key!r}")
         return title_to_id
 
+    def refresh_title_index(self: "ConfluenceClient") -> Dict[str, str]:
+        """Reload the page titles used for conflict checks from Confluence.
+
+        Call this if pages may have been changed in the space by someone else.
+
+        Returns:
+            Dict mapping page titles to page IDs
+        """
+        title_index = self.get_space_page_titles()
+        with self._index_lock:
+            self._title_index = title_index
+            self._title_index_loaded_at = time.monotonic()
+        return title_index
+
+    def _index_title(
+        self: "ConfluenceClient", page_id: Optional[str], title: Optional[str]
+    ) -> None:
+        """Record a page's new title in the title index, if it has been loaded.
+
+        Args:
+            page_id: ID of the created, updated or deleted page
+            title: The page's title, or None if it was deleted
+        """
+        if not page_id:
+            return
+        with self._index_lock:
+            if self._title_index is None or self._title_index.get(title) == page_id:
+                return
+            for existing_title, existing_id in list(self._title_index.items()):
+                if existing_id == page_id:
+                    del self._title_index[existing_title]
+            if title:
+                self._title_index[title] = page_id
+
     def check_title_conflicts(self: "ConfluenceClient", titles: list[str]) -> Dict[str, str]:
         """Check for title conflicts with existing pages in the space.
 
+        The space's titles are fetched once and looked up locally until they are
+        older than TITLE_INDEX_TTL seconds.
+
         Args:
             titles: List of page titles to check for conflicts
 
@@ -504,7 +560,12 @@ class ConfluenceClient:
         """
         logger.info(f"Checking {len(titles)} titles for conflicts in space: {self.space_key}")
 
-        existing_titles = self.get_space_page_titles()
+        existing_titles = self._title_index
+        if (
+            existing_titles is None
+            or time.monotonic() - self._title_index_loaded_at > self.TITLE_INDEX_TTL
+        ):
+            existing_titles = self.refresh_title_index()
         conflicts = {}
 
         for title in titles:
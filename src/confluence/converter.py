@@ -1,11 +1,15 @@
 """Markdown to Confluence XHTML converter."""
 
+import hashlib
 import logging
+import os
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Set, Tuple
 
-import markdown
+if TYPE_CHECKING:
+    import markdown
 
 # from markdown.extensions import fenced_code
 # from markdown.extensions.tables import TableExtension
@@ -13,6 +17,78 @@ import markdown
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import time and shared by all converter instances
+# Opening code fence line, matched against the stripped line: ```lang
+_CODE_FENCE_RE = re.compile(r"```(\w*)")
+_ADMONITION_RE = re.compile(r'<div class="admonition (info|note|warning)">(.*?)</div>', re.DOTALL)
+# Admonition type -> Confluence macro name
+_ADMONITION_MACROS = {
+    "info": "info",
+    "note": "note",
+    "warning": "warning",
+}
+_HTML_IMAGE_RE = re.compile(r'<img src="([^"]+)"(?:\s+alt="([^"]*)")?[^>]*>')
+# Standalone macro syntax that looks like documentation text
+_INCOMPLETE_MACRO_RE = re.compile(r"<ac:structured-macro[^>]*>[^<]*\.\.\.[^<]*\)")
+# Translation tables escape text in a single C-level pass instead of chained replaces
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+_TAG_ESCAPE_TABLE = str.maketrans({"<": "&lt;", ">": "&gt;"})
+_CODE_BLOCK_PLACEHOLDER_RE = re.compile(r"CODE_BLOCK_\d+")
+_LOCAL_IMAGE_PLACEHOLDER_RE = re.compile(r"LOCAL_IMAGE_\d+")
+
+
+def _find_markdown_images(content: str) -> Iterator[Tuple[int, int, str, str, str]]:
+    """Locate markdown images: ![alt](path) or ![alt](path "title").
+
+    Uses str.find over the content instead of a regex with an optional lazy group,
+    so unterminated references cannot trigger backtracking.
+
+    Args:
+        content: The markdown content
+
+    Yields:
+        Tuples of (start, end, alt text, image path, title) for each image
+    """
+    start = content.find("![")
+    while start != -1:
+        alt_end = content.find("]", start + 2)
+        if alt_end == -1:
+            return
+        if content.startswith("(", alt_end + 1):
+            path_start = alt_end + 2
+            close = content.find(")", path_start)
+            match = None
+
+            # A title is whitespace, then "...", then ")" - the title may contain ")"
+            quote = content.find('"', path_start + 1)
+            while quote != -1 and (close == -1 or quote < close) and match is None:
+                space = quote
+                while space > path_start and content[space - 1].isspace():
+                    space -= 1
+                title_end = content.find('"', quote + 1)
+                if (
+                    space < quote
+                    and space > path_start
+                    and title_end != -1
+                    and content.startswith(")", title_end + 1)
+                ):
+                    match = (
+                        title_end + 2,
+                        content[path_start:space],
+                        content[quote + 1 : title_end],
+                    )
+                quote = content.find('"', quote + 1)
+
+            if match is None and close > path_start:
+                match = (close + 1, content[path_start:close], "")
+
+            if match is not None:
+                end, image_path, title = match
+                yield start, end, content[start + 2 : alt_end], image_path, title
+                start = content.find("![", end)
+                continue
+        start = content.find("![", start + 1)
+
 
 class MarkdownConverter:
     """Converts Markdown content to Confluence storage format."""
@@ -23,15 +99,7 @@ class MarkdownConverter:
         <ac:plain-text-body><![CDATA[{code}]]></ac:plain-text-body>
     </ac:structured-macro>"""
 
-    INFO_MACRO_TEMPLATE = """<ac:structured-macro ac:name="info">
-        <ac:rich-text-body>{content}</ac:rich-text-body>
-    </ac:structured-macro>"""
-
-    NOTE_MACRO_TEMPLATE = """<ac:structured-macro ac:name="note">
-        <ac:rich-text-body>{content}</ac:rich-text-body>
-    </ac:structured-macro>"""
-
-    WARNING_MACRO_TEMPLATE = """<ac:structured-macro ac:name="warning">
+    ADMONITION_MACRO_TEMPLATE = """<ac:structured-macro ac:name="{name}">
         <ac:rich-text-body>{content}</ac:rich-text-body>
     </ac:structured-macro>"""
 
@@ -49,28 +117,69 @@ class MarkdownConverter:
     </ac:structured-macro>"""
 
     # Supported image formats
-    SUPPORTED_IMAGE_FORMATS = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
+    SUPPORTED_IMAGE_FORMATS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"})
+
+    # Maximum number of memoized conversion results kept per converter
+    CONVERT_CACHE_SIZE = 256
 
     def __init__(self) -> None:
-        """Initialize the Markdown converter with necessary extensions."""
-        self.md = markdown.Markdown(
-            extensions=[
-                "markdown.extensions.fenced_code",
-                "markdown.extensions.tables",
-                "markdown.extensions.toc",
-                "markdown.extensions.attr_list",
-                "markdown.extensions.def_list",
-                "markdown.extensions.footnotes",
-                # Better line break handling
-                "markdown.extensions.nl2br",
-            ],
-            extension_configs={
-                "markdown.extensions.toc": {
-                    # Don't add permalink symbols
-                    "permalink": False,
-                }
-            },
-        )
+        """Initialize the Markdown converter."""
+        self._md: Optional["markdown.Markdown"] = None
+        self._convert_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+    @property
+    def md(self) -> "markdown.Markdown":
+        """Markdown parser with the necessary extensions, built on first use.
+
+        The markdown package and its extensions are imported lazily so that
+        importing this module stays cheap.
+        """
+        if self._md is None:
+            import markdown
+
+            self._md = markdown.Markdown(
+                extensions=[
+                    "markdown.extensions.fenced_code",
+                    "markdown.extensions.tables",
+                    "markdown.extensions.toc",
+                    "markdown.extensions.attr_list",
+                    "markdown.extensions.def_list",
+                    "markdown.extensions.footnotes",
+                    # Better line break handling
+                    "markdown.extensions.nl2br",
+                ],
+                extension_configs={
+                    "markdown.extensions.toc": {
+                        # Don't add permalink symbols
+                        "permalink": False,
+                    }
+                },
+            )
+        return self._md
+
+    def _cache_key(self, content: str) -> bytes:
+        """Build a conversion cache key from a content digest.
+
+        Args:
+            content: The markdown content
+
+        Returns:
+            Digest of the content
+        """
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+    def _get_cached(self, key: bytes) -> Optional[str]:
+        """Return a cached conversion result, or None on a cache miss."""
+        cached = self._convert_cache.get(key)
+        if cached is not None:
+            self._convert_cache.move_to_end(key)
+        return cached
+
+    def _store_cached(self, key: bytes, result: str) -> None:
+        """Store a conversion result, evicting the least recently used entry if full."""
+        self._convert_cache[key] = result
+        if len(self._convert_cache) > self.CONVERT_CACHE_SIZE:
+            self._convert_cache.popitem(last=False)
 
     def _extract_code_blocks(self: "MarkdownConverter", content: str) -> Tuple[str, dict]:
         """Extract code blocks from content and replace with placeholders.
@@ -83,18 +192,35 @@ class MarkdownConverter:
                 - Content with code blocks replaced by placeholders
                 - Dictionary mapping placeholders to code block info
         """
-        code_blocks = {}
-        pattern = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
+        if "```" not in content:
+            return content, {}
 
-        def replace(match):
-            language = match.group(1) or "text"
-            code = match.group(2)
-            placeholder = f"CODE_BLOCK_{len(code_blocks)}"
-            code_blocks[placeholder] = (language, code)
-            return placeholder
+        code_blocks = {}
+        lines = content.split("\n")
+        processed_lines = []
+        i = 0
+
+        # Single forward scan over lines; a fence without a closing ``` is left untouched
+        while i < len(lines):
+            opening = _CODE_FENCE_RE.fullmatch(lines[i].strip())
+            if opening:
+                end = next((j for j in range(i + 1, len(lines)) if lines[j].strip() == "```"), None)
+                if end is None:
+                    # No closing fence anywhere below, so no later block can close either
+                    processed_lines.extend(lines[i:])
+                    break
+                placeholder = f"CODE_BLOCK_{len(code_blocks)}"
+                code_blocks[placeholder] = (
+                    opening.group(1) or "text",
+                    "\n".join(lines[i + 1 : end]),
+                )
+                processed_lines.append(placeholder)
+                i = end + 1
+                continue
+            processed_lines.append(lines[i])
+            i += 1
 
-        processed_content = pattern.sub(replace, content)
-        return processed_content, code_blocks
+        return "\n".join(processed_lines), code_blocks
 
     def _extract_local_images(
         self, content: str, base_path: Optional[Path] = None
@@ -110,16 +236,27 @@ class MarkdownConverter:
                 - Content with local images replaced by placeholders
                 - Dictionary mapping placeholders to image info
         """
-        local_images = {}
-
-        # Pattern for markdown images: ![alt](path) or ![alt](path "title")
-        pattern = re.compile(r'!\[([^\]]*)\]\(([^)]+?)(?:\s+"([^"]*)")?\)')
-
-        def replace_image(match):
-            alt_text = match.group(1) or ""
-            image_path = match.group(2)
-            title = match.group(3) or ""
+        if "![" not in content:
+            return content, {}
 
+        local_images = {}
+        # Directory listings are read once per directory rather than stat'ing every image
+        dir_listings: Dict[Path, Set[str]] = {}
+
+        def image_exists(image_file: Path) -> bool:
+            directory = image_file.parent
+            if directory not in dir_listings:
+                try:
+                    with os.scandir(directory) as entries:
+                        dir_listings[directory] = {
+                            entry.name for entry in entries if entry.is_file()
+                        }
+                except OSError:
+                    dir_listings[directory] = set()
+            # Fall back to a stat on a miss so case-insensitive filesystems still match
+            return image_file.name in dir_listings[directory] or image_file.is_file()
+
+        def replace_image(alt_text: str, image_path: str, title: str) -> Optional[str]:
             # Check if it's a local image (not http/https)
             if not image_path.startswith(("http://", "https://", "data:")):
                 # Resolve relative path if base_path provided
@@ -129,7 +266,7 @@ class MarkdownConverter:
                     full_path = Path(image_path)
 
                 # Check if file exists and is supported format
-                if full_path.exists() and self._is_supported_image(full_path):
+                if self._is_supported_image(full_path) and image_exists(full_path):
                     placeholder = f"LOCAL_IMAGE_{len(local_images)}"
                     local_images[placeholder] = {
                         "path": full_path,
@@ -144,10 +281,22 @@ class MarkdownConverter:
                     logger.warning(f"Image not found or unsupported format: {image_path}")
 
             # Keep external images or unsupported files as-is
-            return match.group(0)
+            return None
 
-        processed_content = pattern.sub(replace_image, content)
-        return processed_content, local_images
+        parts = []
+        position = 0
+        for start, end, alt_text, image_path, title in _find_markdown_images(content):
+            placeholder = replace_image(alt_text, image_path, title)
+            if placeholder is not None:
+                parts.append(content[position:start])
+                parts.append(placeholder)
+                position = end
+
+        if not parts:
+            return content, local_images
+
+        parts.append(content[position:])
+        return "".join(parts), local_images
 
     def _is_supported_image(self, file_path: Path) -> bool:
         """Check if the image format is supported by Confluence.
@@ -169,32 +318,16 @@ class MarkdownConverter:
         Returns:
             Content with admonitions converted to Confluence macros
         """
-        # Process !!! info blocks
-        content = re.sub(
-            r'<div class="admonition info">(.*?)</div>',
-            lambda m: self.INFO_MACRO_TEMPLATE.format(content=m.group(1)),
-            content,
-            flags=re.DOTALL,
-        )
+        if 'class="admonition' not in content:
+            return content
 
-        # Process !!! note blocks
-        content = re.sub(
-            r'<div class="admonition note">(.*?)</div>',
-            lambda m: self.NOTE_MACRO_TEMPLATE.format(content=m.group(1)),
+        return _ADMONITION_RE.sub(
+            lambda m: self.ADMONITION_MACRO_TEMPLATE.format(
+                name=_ADMONITION_MACROS[m.group(1)], content=m.group(2)
+            ),
             content,
-            flags=re.DOTALL,
         )
 
-        # Process !!! warning blocks
-        content = re.sub(
-            r'<div class="admonition warning">(.*?)</div>',
-            lambda m: self.WARNING_MACRO_TEMPLATE.format(content=m.group(1)),
-            content,
-            flags=re.DOTALL,
-        )
-
-        return content
-
     def _restore_code_blocks(self: "MarkdownConverter", content: str, code_blocks: dict) -> str:
         """Restore code blocks from placeholders.
 
@@ -205,10 +338,17 @@ class MarkdownConverter:
         Returns:
             Content with code blocks restored as Confluence macros
         """
-        for placeholder, (language, code) in code_blocks.items():
-            macro = self.CODE_MACRO_TEMPLATE.format(language=language, code=code.strip())
-            content = content.replace(placeholder, macro)
-        return content
+        if not code_blocks:
+            return content
+
+        def restore(match):
+            placeholder = match.group(0)
+            if placeholder not in code_blocks:
+                return placeholder
+            language, code = code_blocks[placeholder]
+            return self.CODE_MACRO_TEMPLATE.format(language=language, code=code.strip())
+
+        return _CODE_BLOCK_PLACEHOLDER_RE.sub(restore, content)
 
     def _restore_local_images(
         self, content: str, local_images: Dict, uploaded_attachments: Dict[str, bool]
@@ -223,7 +363,15 @@ class MarkdownConverter:
         Returns:
             Content with images restored as Confluence macros or fallbacks
         """
-        for placeholder, image_info in local_images.items():
+        if not local_images:
+            return content
+
+        def restore(match):
+            placeholder = match.group(0)
+            image_info = local_images.get(placeholder)
+            if image_info is None:
+                return placeholder
+
             filename = image_info["filename"]
             alt_text = image_info["alt"]
 
@@ -231,18 +379,16 @@ class MarkdownConverter:
             if uploaded_attachments.get(placeholder, False):
                 # Create Confluence attachment image macro
                 width_attr = ' ac:width="600"' if alt_text else ""  # Default width for images
-                image_macro = self.IMAGE_ATTACHMENT_TEMPLATE.format(
+                logger.debug(f"Replaced {placeholder} with attachment macro for {filename}")
+                return self.IMAGE_ATTACHMENT_TEMPLATE.format(
                     alt_text=alt_text, filename=filename, width_attr=width_attr
                 )
-                content = content.replace(placeholder, image_macro)
-                logger.debug(f"Replaced {placeholder} with attachment macro for {filename}")
-            else:
-                # Create fallback for failed upload
-                fallback = self._create_image_fallback(image_info)
-                content = content.replace(placeholder, fallback)
-                logger.warning(f"Replaced {placeholder} with fallback for {filename}")
 
-        return content
+            # Create fallback for failed upload
+            logger.warning(f"Replaced {placeholder} with fallback for {filename}")
+            return self._create_image_fallback(image_info)
+
+        return _LOCAL_IMAGE_PLACEHOLDER_RE.sub(restore, content)
 
     def _create_image_fallback(self, image_info: Dict) -> str:
         """Create a fallback placeholder for failed image uploads.
@@ -253,8 +399,8 @@ class MarkdownConverter:
         Returns:
             Confluence macro for the image fallback
         """
-        original_name = image_info["original_name"]
-        alt_text = image_info["alt"]
+        original_name = image_info["original_name"].translate(_HTML_ESCAPE_TABLE)
+        alt_text = image_info["alt"].translate(_HTML_ESCAPE_TABLE)
 
         alt_text_paragraph = f"<p><em>{alt_text}</em></p>" if alt_text else ""
 
@@ -287,29 +433,39 @@ class MarkdownConverter:
 
             return f"<img src={src!r} alt={alt!r}/>"
 
-        image_pattern = r'<img src="([^"]+)"(?:\s+alt="([^"]*)")?[^>]*>'
-        return re.sub(image_pattern, process_image, content)
+        if "<img" not in content:
+            return content
 
-    def convert(self: "MarkdownConverter", content: str, base_path: Optional[Path] = None) -> str:
-        """Convert Markdown content to Confluence storage format.
+        return _HTML_IMAGE_RE.sub(process_image, content)
+
+    def _render(self, content: str, code_blocks: dict, base_path: Optional[Path] = None) -> str:
+        """Render placeholder-bearing markdown to Confluence storage format.
+
+        This is the only step that runs the markdown pipeline; placeholders left in
+        the output are substituted later without re-parsing.
 
         Args:
-            content: The markdown content to convert
+            content: Markdown content with code blocks already extracted
+            code_blocks: Dictionary mapping placeholders to code block info
             base_path: Optional base path for resolving relative paths
 
         Returns:
-            The converted content in Confluence storage format
+            The rendered content in Confluence storage format
         """
-        logger.info("Converting markdown content to Confluence format")
-
-        # Extract code blocks before markdown conversion
-        content, code_blocks = self._extract_code_blocks(content)
-
-        # Convert markdown to HTML
-        html_content = self.md.convert(content)
-
-        # Process admonitions
-        html_content = self._process_admonitions(html_content)
+        # The markdown pipeline does not look at the filesystem, so its output is
+        # cached; image paths are resolved below on every call
+        cache_key = self._cache_key(content)
+        html_content = self._get_cached(cache_key)
+        if html_content is None:
+            # Convert markdown to HTML; reset first so footnotes and other extension
+            # state from the previous document do not leak into this one
+            html_content = self.md.reset().convert(content)
+
+            # Process admonitions
+            html_content = self._process_admonitions(html_content)
+            self._store_cached(cache_key, html_content)
+        else:
+            logger.debug("Markdown rendering served from cache")
 
         # Process images
         html_content = self._process_images(html_content, base_path)
@@ -326,7 +482,25 @@ class MarkdownConverter:
 
         # Escape any Confluence macro syntax that appears in regular text
         # This prevents accidentally creating malformed macros
-        html_content = self._escape_confluence_syntax(html_content)
+        return self._escape_confluence_syntax(html_content)
+
+    def convert(self: "MarkdownConverter", content: str, base_path: Optional[Path] = None) -> str:
+        """Convert Markdown content to Confluence storage format.
+
+        Args:
+            content: The markdown content to convert
+            base_path: Optional base path for resolving relative paths
+
+        Returns:
+            The converted content in Confluence storage format
+        """
+        logger.info("Converting markdown content to Confluence format")
+
+        # Extract code blocks before markdown conversion
+        content, code_blocks = self._extract_code_blocks(content)
+
+        # Render markdown to Confluence storage format
+        html_content = self._render(content, code_blocks, base_path)
 
         # logger.info(f"Converted content: {html_content}")
         logger.debug("Markdown conversion completed")
@@ -354,27 +528,8 @@ class MarkdownConverter:
         # Extract local images before markdown conversion
         content, local_images = self._extract_local_images(content, base_path)
 
-        # Convert markdown to HTML
-        html_content = self.md.convert(content)
-
-        # Process admonitions
-        html_content = self._process_admonitions(html_content)
-
-        # Process remaining external images (non-local ones)
-        html_content = self._process_images(html_content, base_path)
-
-        # Restore code blocks with Confluence macros
-        html_content = self._restore_code_blocks(html_content, code_blocks)
-
-        # Clean up the HTML to match Confluence's expectations
-        html_content = html_content.replace(
-            "&amp;", "&"
-        ).replace(  # Confluence prefers unescaped ampersands
-            "<br>", "<br />"
-        )  # Use self-closing tags
-
-        # Escape any Confluence macro syntax that appears in regular text
-        html_content = self._escape_confluence_syntax(html_content)
+        # Remaining external images are handled by the render step
+        html_content = self._render(content, code_blocks, base_path)
 
         logger.debug(f"Markdown conversion completed with {len(local_images)} local images")
         return html_content, local_images
@@ -384,6 +539,8 @@ class MarkdownConverter:
     ) -> str:
         """Finalize content by replacing image placeholders with proper macros.
 
+        Only placeholder substitution happens here; the markdown is not re-rendered.
+
         Args:
             content: Content with image placeholders
             local_images: Dictionary of local images info
@@ -404,35 +561,21 @@ class MarkdownConverter:
         Returns:
             Content with Confluence syntax properly escaped
         """
-        # Find any ac:structured-macro tags that are not properly closed
-        # and escape them to prevent malformed XML
-
-        # Pattern to match incomplete macro syntax (missing closing tag)
-        # This matches things like: <ac:structured-macro ac:name="code">...)
-        # but NOT complete macros that have proper closing tags
-        import re
-
-        # Look for structured-macro openings that don't have corresponding closings
-        def escape_incomplete_macros(match):
-            macro_text = match.group(0)
-            # Check if this appears to be part of documentation text rather than a real macro
-            # Real macros should have proper parameter structure and closing tags
-            if "..." in macro_text or not re.search(
-                r"</ac:structured-macro>", content[match.end() : match.end() + 500]
-            ):
-                # This looks like documentation text, escape it
-                return macro_text.replace("<", "&lt;").replace(">", "&gt;")
-            return macro_text
-
-        # Find standalone macro syntax that looks like documentation
-        pattern = r"<ac:structured-macro[^>]*>[^<]*\.\.\.[^<]*\)"
-        content = re.sub(pattern, escape_incomplete_macros, content)
-
-        return content
+        # Pattern to match incomplete macro syntax used as documentation text,
+        # e.g. <ac:structured-macro ac:name="code">...) - complete macros never
+        # match since the opening tag must be followed by "..." and ")" before
+        # any other tag. Every match is therefore escaped in a single pass.
+        if "..." not in content:
+            return content
+
+        return _INCOMPLETE_MACRO_RE.sub(lambda m: m.group(0).translate(_TAG_ESCAPE_TABLE), content)
 
     def convert_file(self: "MarkdownConverter", file_path: Path) -> str:
         """Convert a markdown file to Confluence storage format.
 
+        Unchanged files reuse the cached markdown render; referenced images are
+        resolved again on every call.
+
         Args:
             file_path: Path to the markdown file
 
@@ -1,6 +1,7 @@
 """Conflict detection and resolution for Confluence page synchronization."""
 
 import logging
+from collections import Counter
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -182,12 +183,7 @@ class ConflictDetector:
         Returns:
             Dict with conflict type counts
         """
-        summary = {}
-        for conflict in self.detected_conflicts:
-            conflict_type = conflict.conflict_type.value
-            summary[conflict_type] = summary.get(conflict_type, 0) + 1
-
-        return summary
+        return dict(Counter(conflict.conflict_type.value for conflict in self.detected_conflicts))
 
     def clear_conflicts(self) -> None:
         """Clear all detected conflicts."""
@@ -1,11 +1,14 @@
 """SyncEngine: Orchestrates file events and synchronizes with Confluence."""
 
+import functools
 import logging
+import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from queue import Empty, Queue
-from typing import Any, Dict, Optional
+from queue import Empty, SimpleQueue
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.confluence.client import ConfluenceClient
 from src.confluence.converter import MarkdownConverter
@@ -19,6 +22,37 @@ from src.sync.state import SyncState
 
 logger = logging.getLogger(__name__)
 
+# Directories that are not synced as folder pages, along with any hidden directory
+_SKIP_FOLDERS = frozenset(
+    {"__pycache__", ".git", ".vscode", ".idea", "node_modules", ".pytest_cache"}
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_resolve(path: str) -> Path:
+    """Resolve an absolute path string, remembering the result per unique path.
+
+    Args:
+        path: Absolute path to resolve
+
+    Returns:
+        The path with symlinks resolved
+    """
+    return Path(os.path.realpath(path))
+
+
+@functools.lru_cache(maxsize=4096)
+def _title_from_name(name: str) -> str:
+    """Convert a file stem or folder name to a Confluence page title.
+
+    Args:
+        name: File name without extension, or folder name
+
+    Returns:
+        The name with underscores and hyphens replaced by spaces, in title case
+    """
+    return name.replace("_", " ").replace("-", " ").title()
+
 
 class SyncEvent:
     """Event for file synchronization."""
@@ -26,8 +60,8 @@ class SyncEvent:
     def __init__(self, event_type: str, file_path: Path):
         """Initialize the SyncEvent."""
         self.event_type = event_type  # 'created', 'modified', 'deleted'
-        self.file_path = file_path.resolve()
-        self.timestamp = time.time()
+        self.file_path = _cached_resolve(os.path.abspath(os.fspath(file_path)))
+        self.timestamp = time.monotonic_ns()
 
     def __repr__(self):
         """Return a string representation of the SyncEvent."""
@@ -40,13 +74,25 @@ class SyncEngine:
     _instance = None
     _lock = threading.Lock()
 
+    # Force a flush once this many distinct events are pending
+    MAX_PENDING_EVENTS = 10_000
+    RELATIVE_PATH_CACHE_SIZE = 4096
+    # Concurrent attachment uploads per page
+    MAX_UPLOAD_WORKERS = 4
+    # Seconds between batched writes of the sync state file
+    STATE_FLUSH_INTERVAL = 0.5
+
     @classmethod
     def get_instance(cls: type["SyncEngine"], *args: Any, **kwargs: Any) -> "SyncEngine":
-        """Get the instance of the SyncEngine."""
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = cls(*args, **kwargs)
-            return cls._instance
+        """Get the instance of the SyncEngine.
+
+        Uses double-checked locking so lookups of an existing instance skip the lock.
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(*args, **kwargs)
+        return cls._instance
 
     def __init__(
         self: "SyncEngine",
@@ -56,18 +102,42 @@ class SyncEngine:
         converter: MarkdownConverter,
         debounce_interval: float = 1.0,
         conflict_strategy: ConflictResolutionStrategy = ConflictResolutionStrategy.SKIP,
+        autostart: bool = True,
     ) -> None:
-        """Initialize the SyncEngine."""
+        """Initialize the SyncEngine.
+
+        Args:
+            docs_dir: Directory of markdown files to sync
+            state_file: Path to the JSON file for storing sync state
+            confluence_client: Client used to talk to Confluence
+            converter: Markdown to Confluence storage format converter
+            debounce_interval: Seconds to coalesce bursts of events for
+            conflict_strategy: How to resolve title conflicts with existing pages
+            autostart: Start the worker thread immediately; otherwise call start()
+        """
         if SyncEngine._instance is not None:
             raise Exception("SyncEngine is a singleton. Use get_instance().")
         self.docs_dir = docs_dir.resolve()
-        self.state = SyncState(state_file)
+        self._docs_prefix = str(self.docs_dir).rstrip(os.sep) + os.sep
+        self.state = SyncState(state_file, flush_interval=self.STATE_FLUSH_INTERVAL)
         self.confluence = confluence_client
         self.converter = converter
         self.debounce_interval = debounce_interval
+        self._debounce_interval_ns = int(debounce_interval * 1e9)
         self.conflict_detector = ConflictDetector(default_strategy=conflict_strategy)
-        self.event_queue = Queue()
+        self._relative_paths: Dict[Path, str] = {}
+        # Title conflicts fetched for the batch of events the worker is processing
+        self._title_conflicts: Optional[Dict[str, str]] = None
+        self.event_queue: "SimpleQueue[SyncEvent]" = SimpleQueue()
         self._stop_event = threading.Event()
+        self._worker_thread: Optional[threading.Thread] = None
+        if autostart:
+            self.start()
+
+    def start(self: "SyncEngine") -> None:
+        """Start the worker thread that processes enqueued events, if not already running."""
+        if self._worker_thread is not None:
+            return
         self._worker_thread = threading.Thread(target=self._worker, daemon=True)
         self._worker_thread.start()
         logger.info("SyncEngine started.")
@@ -78,53 +148,120 @@ class SyncEngine:
         self.event_queue.put(event)
 
     def _worker(self: "SyncEngine") -> None:
-        """Worker thread for processing events."""
-        last_event: Dict[Path, SyncEvent] = {}
-        last_processed: Dict[Path, float] = {}
+        """Worker thread for processing events.
+
+        Events arriving within the debounce interval of the first one are coalesced
+        by (path, event type), so a burst of saves to one file is processed once.
+        """
         while not self._stop_event.is_set():
             try:
                 event: SyncEvent = self.event_queue.get(timeout=0.2)
-                now = time.time()
-                # Debounce: Only process if enough time has passed since last
-                # event for this file
-                last = last_processed.get(event.file_path, 0)
-                if now - last < self.debounce_interval:
-                    # Replace with the latest event for this file
-                    last_event[event.file_path] = event
-                    continue
-                # Process event
-                self._process_event(event)
-                last_processed[event.file_path] = now
-                # If there was a debounced event
-                # process it after debounce interval
-                if event.file_path in last_event:
-                    time.sleep(self.debounce_interval)
-                    self._process_event(last_event.pop(event.file_path))
-                    last_processed[event.file_path] = time.time()
             except Empty:
                 continue
-            except Exception as e:
-                logger.error(f"Error in SyncEngine worker: {e}")
 
-    def _get_relative_path(self: "SyncEngine", file_path: Path) -> Optional[Path]:
+            pending: Dict[Tuple[Path, str], SyncEvent] = {}
+            self._add_pending(pending, event)
+            # The window starts when the first event was created, not when it was dequeued
+            deadline_ns = event.timestamp + self._debounce_interval_ns
+            while len(pending) < self.MAX_PENDING_EVENTS:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                try:
+                    if remaining_ns > 0:
+                        next_event = self.event_queue.get(timeout=remaining_ns / 1e9)
+                    else:
+                        # Past the window, still take everything already queued so a
+                        # backlog is coalesced instead of processed one event at a time
+                        next_event = self.event_queue.get_nowait()
+                except Empty:
+                    break
+                self._add_pending(pending, next_event)
+
+            self._title_conflicts = self._check_batch_title_conflicts(pending.values())
+            try:
+                for pending_event in pending.values():
+                    try:
+                        self._process_event(pending_event)
+                    except Exception as e:
+                        logger.error(f"Error in SyncEngine worker: {e}")
+            finally:
+                self._title_conflicts = None
+
+    @staticmethod
+    def _add_pending(pending: Dict[Tuple[Path, str], SyncEvent], event: SyncEvent) -> None:
+        """Record an event, replacing and reordering any earlier one for the same key.
+
+        Args:
+            pending: Pending events keyed by (path, event type)
+            event: The event to record
+        """
+        key = (event.file_path, event.event_type)
+        pending.pop(key, None)
+        pending[key] = event
+
+    def _check_batch_title_conflicts(
+        self: "SyncEngine", events: Iterable[SyncEvent]
+    ) -> Optional[Dict[str, str]]:
+        """Check the titles of all pages a batch of events would create in one request.
+
+        Args:
+            events: The events about to be processed
+
+        Returns:
+            Dict mapping conflicting titles to existing page IDs, or None if the batch
+            creates fewer than two pages or the check failed
+        """
+        titles = [
+            _title_from_name(
+                event.file_path.name
+                if event.event_type == "folder_created"
+                else event.file_path.stem
+            )
+            for event in events
+            if event.event_type in ("created", "modified", "folder_created")
+            and not self.state.get_page_id(str(event.file_path))
+        ]
+        if len(titles) < 2:
+            return None
+
+        try:
+            return self.confluence.check_title_conflicts(titles)
+        except Exception as e:
+            logger.error(f"Error checking conflicts for {len(titles)} titles: {e}")
+            return None
+
+    def _get_relative_path(self: "SyncEngine", file_path: Path) -> Optional[str]:
         """Get the relative path from docs_dir to file_path.
 
         Args:
             file_path: The file path to get the relative path for
 
         Returns:
-            The relative path if file_path is under docs_dir, None otherwise
+            The "/"-separated relative path if file_path is under docs_dir, None otherwise
         """
-        try:
-            return file_path.relative_to(self.docs_dir)
-        except ValueError:
+        rel_path = self._relative_paths.get(file_path)
+        if rel_path is not None:
+            return rel_path
+
+        path_str = str(file_path)
+        if path_str.startswith(self._docs_prefix):
+            rel_path = path_str[len(self._docs_prefix) :]
+            if os.sep != "/":
+                rel_path = rel_path.replace(os.sep, "/")
+        elif file_path == self.docs_dir:
+            rel_path = "."
+        else:
             logger.error(f"File '{file_path!r}' is not under docs directory '{self.docs_dir!r}'")
             return None
 
+        self._relative_paths[file_path] = rel_path
+        if len(self._relative_paths) > self.RELATIVE_PATH_CACHE_SIZE:
+            del self._relative_paths[next(iter(self._relative_paths))]
+        return rel_path
+
     def _process_event(self: "SyncEngine", event: SyncEvent) -> None:
         """Process a single sync event."""
         logger.info(f"Processing event: {event}")
-        file_path = event.file_path.resolve()  # Ensure consistent path resolution
+        file_path = event.file_path  # Already resolved by SyncEvent
 
         try:
             # Get relative path and validate it's under docs_dir
@@ -133,7 +270,7 @@ class SyncEngine:
                 return
 
             if event.event_type == "created" or event.event_type == "modified":
-                if not file_path.exists():
+                if not os.path.exists(file_path):
                     logger.warning(f"File not found: {file_path}")
                     return
 
@@ -144,7 +281,7 @@ class SyncEngine:
                 )
 
                 page_id = self.state.get_page_id(str(file_path))
-                title = self._get_title_from_path(file_path)
+                title = _title_from_name(file_path.stem)  # read_text succeeded, so a file
                 parent_id = self._get_parent_page_id(rel_path)
 
                 # Check for conflicts before creating new pages
@@ -174,6 +311,7 @@ class SyncEngine:
                     page_id = page["id"]
                     logger.info(f"Created page for {file_path} with ID {page_id}")
                     self.state.add_mapping(str(file_path), page_id, time.time())
+                    self._record_created_title(title, page_id)
 
                 # Upload images and update content if there are local images
                 if local_images:
@@ -196,16 +334,18 @@ class SyncEngine:
                 self.state.add_mapping(str(file_path), page_id, time.time())
 
             elif event.event_type == "deleted":
+                self._relative_paths.pop(file_path, None)
                 page_id = self.state.get_page_id(str(file_path))
                 if page_id:
                     self.confluence.delete_page(page_id)
                     self.state.remove_mapping(str(file_path))
+                    self._forget_deleted_title(page_id)
                     logger.info(f"Deleted page for {file_path}")
                 else:
                     logger.warning(f"No page mapping found for deleted file: {file_path}")
 
             elif event.event_type == "folder_created":
-                if not file_path.exists():
+                if not os.path.exists(file_path):
                     logger.warning(f"Folder not found: {file_path}")
                     return
 
@@ -216,7 +356,7 @@ class SyncEngine:
 
                 # Generate folder page content
                 folder_content = self._generate_folder_page_content(file_path)
-                title = self._get_title_from_path(file_path)
+                title = _title_from_name(file_path.name)
                 parent_id = self._get_parent_page_id(rel_path)
 
                 # Check for conflicts before creating folder page
@@ -235,6 +375,7 @@ class SyncEngine:
                 page_id = page["id"]
                 logger.info(f"Created folder page for {file_path} with ID {page_id}")
                 self.state.add_mapping(str(file_path), page_id, time.time())
+                self._record_created_title(title, page_id)
 
             elif event.event_type == "folder_deleted":
                 # Handle folder deletion with recursive child deletion
@@ -244,70 +385,81 @@ class SyncEngine:
             logger.error(f"Error processing event {event}: {e}")
             # Don't re-raise the exception to allow the sync engine to continue
 
-    def _get_parent_page_id(self: "SyncEngine", rel_path: Path) -> Optional[str]:
+    def _get_parent_page_id(self: "SyncEngine", rel_path: str) -> Optional[str]:
         """Get the parent page ID for a file.
 
         Args:
-            rel_path: The path relative to docs_dir
+            rel_path: The "/"-separated path relative to docs_dir
 
         Returns:
             The parent page ID or None for top-level files
         """
-        if rel_path.parent == Path("."):
+        parent, separator, _ = rel_path.rpartition("/")
+        if not separator:
             # Top-level file, parent is the root page (should be configured)
             # For now, return None (should be set in config)
             return None
-        parent_dir = self.docs_dir / rel_path.parent
-        return self.state.get_page_id(str(parent_dir))
+        if os.sep != "/":
+            parent = parent.replace("/", os.sep)
+        return self.state.get_page_id(self._docs_prefix + parent)
 
     def _upload_images(self, page_id: str, local_images: Dict) -> Dict[str, bool]:
         """Upload local images as attachments to the Confluence page.
 
+        Each distinct image file is uploaded once; uploads run concurrently, except
+        that files sharing an attachment filename are uploaded one after another.
+
         Args:
             page_id: ID of the Confluence page
-            local_images: Dictionary of local images to upload
+            local_images: Dictionary mapping placeholders to the local images to upload
 
         Returns:
-            Dictionary mapping filenames to upload success status
+            Dictionary mapping placeholders to upload success status
         """
-        uploaded_attachments = {}
-
-        for _, image_info in local_images.items():
-            file_path = image_info["path"]
-            filename = image_info["filename"]
-
-            try:
-                result = self.confluence.upload_attachment(page_id, file_path)
-                uploaded_attachments[filename] = result is not None
-                if result:
-                    logger.info(f"Successfully uploaded {filename}")
-                else:
-                    logger.error(f"Failed to upload {filename}")
-            except Exception as e:
-                logger.error(f"Error uploading {filename}: {e}")
-                uploaded_attachments[filename] = False
+        uploaded_attachments: Dict[str, bool] = {}
+        placeholders_by_path: Dict[Path, List[str]] = {}
+        for placeholder, image_info in local_images.items():
+            placeholders_by_path.setdefault(image_info["path"], []).append(placeholder)
+
+        if not placeholders_by_path:
+            return uploaded_attachments
+
+        # upload_attachment replaces an existing attachment of the same name, so
+        # concurrent uploads of a/diagram.png and b/diagram.png would interleave
+        paths_by_filename: Dict[str, List[Path]] = {}
+        for file_path in placeholders_by_path:
+            paths_by_filename.setdefault(file_path.name, []).append(file_path)
+
+        def upload_in_order(file_paths: List[Path]) -> List[Tuple[Path, bool]]:
+            results = []
+            for file_path in file_paths:
+                filename = file_path.name
+                try:
+                    result = self.confluence.upload_attachment(page_id, file_path)
+                    success = result is not None
+                    if result:
+                        logger.info(f"Successfully uploaded {filename}")
+                    else:
+                        logger.error(f"Failed to upload {filename}")
+                except Exception as e:
+                    logger.error(f"Error uploading {filename}: {e}")
+                    success = False
+                results.append((file_path, success))
+            return results
+
+        max_workers = min(self.MAX_UPLOAD_WORKERS, len(paths_by_filename))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(upload_in_order, file_paths)
+                for file_paths in paths_by_filename.values()
+            ]
+            for future in as_completed(futures):
+                for file_path, success in future.result():
+                    for placeholder in placeholders_by_path[file_path]:
+                        uploaded_attachments[placeholder] = success
 
         return uploaded_attachments
 
-    def _get_title_from_path(self: "SyncEngine", path: Path) -> str:
-        """Convert a file or folder path to a Confluence page title.
-
-        Args:
-            path: The file or folder path
-
-        Returns:
-            A formatted title for the Confluence page
-        """
-        if path.is_file():
-            # For files, use the stem (filename without extension)
-            name = path.stem
-        else:
-            # For folders, use the folder name
-            name = path.name
-
-        # Apply title conversion: replace underscores and hyphens with spaces, then title case
-        return name.replace("_", " ").replace("-", " ").title()
-
     def _generate_folder_page_content(self: "SyncEngine", folder_path: Path) -> str:
         """Generate content for a folder page.
 
@@ -317,7 +469,7 @@ class SyncEngine:
         Returns:
             XHTML content for the folder page
         """
-        folder_name = self._get_title_from_path(folder_path)
+        folder_name = _title_from_name(folder_path.name)
 
         # Simple folder page template
         template = f"""<h1>{folder_name}</h1>
@@ -357,65 +509,85 @@ class SyncEngine:
         # Sort by depth (deepest first) to ensure children are deleted before parents
         children_to_delete.sort(key=lambda p: len(Path(p).parts), reverse=True)
 
-        # Delete all children first
-        for child_path in children_to_delete:
-            if child_path != folder_str:  # Don't delete the folder itself yet
-                page_id = self.state.get_page_id(child_path)
-                if page_id:
-                    try:
-                        self.confluence.delete_page(page_id)
-                        self.state.remove_mapping(child_path)
-                        logger.info(f"Deleted child page for {child_path}")
-                    except Exception as e:
-                        logger.error(f"Failed to delete child page {child_path}: {e}")
+        with self.state.batch_update():
+            # Delete all children first
+            for child_path in children_to_delete:
+                if child_path != folder_str:  # Don't delete the folder itself yet
+                    page_id = self.state.get_page_id(child_path)
+                    if page_id:
+                        try:
+                            self.confluence.delete_page(page_id)
+                            self.state.remove_mapping(child_path)
+                            self._forget_deleted_title(page_id)
+                            logger.info(f"Deleted child page for {child_path}")
+                        except Exception as e:
+                            logger.error(f"Failed to delete child page {child_path}: {e}")
+
+            # Finally, delete the folder page itself
+            page_id = self.state.get_page_id(folder_str)
+            if page_id:
+                try:
+                    self.confluence.delete_page(page_id)
+                    self.state.remove_mapping(folder_str)
+                    self._forget_deleted_title(page_id)
+                    logger.info(f"Deleted folder page for {folder_path}")
+                except Exception as e:
+                    logger.error(f"Failed to delete folder page {folder_path}: {e}")
+            else:
+                logger.warning(f"No page mapping found for deleted folder: {folder_path}")
+
+    def _walk_docs_dir(self: "SyncEngine") -> Tuple[List[str], List[str]]:
+        """Walk docs_dir with os.scandir, collecting the folders and markdown files to sync.
 
-        # Finally, delete the folder page itself
-        page_id = self.state.get_page_id(folder_str)
-        if page_id:
+        Hidden and system directories are not synced as folder pages, but markdown
+        files inside them still are.
+
+        Returns:
+            Tuple of (folder paths ordered parents first, markdown file paths)
+        """
+
+        def is_skipped(name: str) -> bool:
+            return name.startswith(".") or name in _SKIP_FOLDERS
+
+        all_dirs: List[Tuple[int, str]] = []
+        md_files: List[str] = []
+        base_skipped = any(is_skipped(part) for part in self.docs_dir.parts)
+        pending_dirs = [(self.docs_dir, 0, base_skipped)]
+        while pending_dirs:
+            directory, depth, skipped = pending_dirs.pop()
             try:
-                self.confluence.delete_page(page_id)
-                self.state.remove_mapping(folder_str)
-                logger.info(f"Deleted folder page for {folder_path}")
-            except Exception as e:
-                logger.error(f"Failed to delete folder page {folder_path}: {e}")
-        else:
-            logger.warning(f"No page mapping found for deleted folder: {folder_path}")
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            entry_skipped = skipped or is_skipped(entry.name)
+                            if not entry_skipped:
+                                all_dirs.append((depth + 1, entry.path))
+                            pending_dirs.append((entry.path, depth + 1, entry_skipped))
+                        elif entry.name.endswith(".md") and entry.is_file():
+                            md_files.append(entry.path)
+            except OSError as e:
+                # Keep scanning the rest of the tree, as rglob did
+                logger.warning(f"Skipping unreadable directory {directory}: {e}")
+
+        # Sort by depth (parents first) to ensure proper hierarchy
+        all_dirs.sort(key=lambda item: item[0])
+        return [dir_path for _, dir_path in all_dirs], md_files
 
     def initial_scan(self: "SyncEngine") -> None:
         """
         Scan docs_dir for .md files and folders
         and enqueue 'created'/'folder_created' events for untracked items.
         """
-        # First, scan for folders (process in hierarchical order - parents first)
-        all_dirs = []
-        for item in self.docs_dir.rglob("*"):
-            if item.is_dir():
-                # Skip hidden and system directories
-                if any(part.startswith(".") for part in item.parts):
-                    continue
-                skip_folders = {
-                    "__pycache__",
-                    ".git",
-                    ".vscode",
-                    ".idea",
-                    "node_modules",
-                    ".pytest_cache",
-                }
-                if any(part in skip_folders for part in item.parts):
-                    continue
-                all_dirs.append(item)
-
-        # Sort by depth (parents first) to ensure proper hierarchy
-        all_dirs.sort(key=lambda p: len(p.parts))
+        all_dirs, md_files = self._walk_docs_dir()
 
         for dir_path in all_dirs:
-            if not self.state.get_page_id(str(dir_path)):
-                self.enqueue_event(SyncEvent("folder_created", dir_path))
+            if not self.state.get_page_id(dir_path):
+                self.enqueue_event(SyncEvent("folder_created", Path(dir_path)))
 
-        # Then, scan for markdown files
-        for file_path in self.docs_dir.rglob("*.md"):
-            if not self.state.get_page_id(str(file_path)):
-                self.enqueue_event(SyncEvent("created", file_path))
+        # Then, enqueue untracked markdown files
+        for file_path in md_files:
+            if not self.state.get_page_id(file_path):
+                self.enqueue_event(SyncEvent("created", Path(file_path)))
 
     def _check_and_resolve_conflicts(
         self: "SyncEngine", title: str, file_path: Path
@@ -430,10 +602,12 @@ class SyncEngine:
             Resolved title or None if page should be skipped
         """
         try:
-            # Check for conflicts with existing pages
-            conflicts = self.confluence.check_title_conflicts([title])
+            # Check for conflicts with existing pages, reusing the worker's batch check
+            conflicts = self._title_conflicts
+            if conflicts is None:
+                conflicts = self.confluence.check_title_conflicts([title])
 
-            if not conflicts:
+            if title not in conflicts:
                 return title  # No conflicts, use original title
 
             # Conflict detected, use conflict detector to resolve
@@ -460,6 +634,29 @@ class SyncEngine:
             # On error, default to original title to avoid blocking sync
             return title
 
+    def _record_created_title(self: "SyncEngine", title: str, page_id: str) -> None:
+        """Make a page created mid-batch visible to the batch's remaining conflict checks.
+
+        Args:
+            title: Title of the created page
+            page_id: ID of the created page
+        """
+        if self._title_conflicts is not None:
+            self._title_conflicts[title] = page_id
+
+    def _forget_deleted_title(self: "SyncEngine", page_id: str) -> None:
+        """Stop a page deleted mid-batch from conflicting with the batch's remaining events.
+
+        A move arrives as a deletion and a creation, so the recreated page must not
+        be skipped because of the title of the page that was just deleted.
+
+        Args:
+            page_id: ID of the deleted page
+        """
+        if self._title_conflicts is not None:
+            for title in [t for t, pid in self._title_conflicts.items() if pid == page_id]:
+                del self._title_conflicts[title]
+
     def scan_for_conflicts(self: "SyncEngine") -> Dict[str, str]:
         """Scan all untracked files and folders for potential conflicts.
 
@@ -468,33 +665,19 @@ class SyncEngine:
         """
         logger.info("Scanning for potential conflicts...")
 
-        proposed_titles = []
-
-        # Scan for untracked markdown files
-        for file_path in self.docs_dir.rglob("*.md"):
-            if not self.state.get_page_id(str(file_path)):
-                title = self._get_title_from_path(file_path)
-                proposed_titles.append(title)
-
-        # Scan for untracked folders
-        for dir_path in self.docs_dir.rglob("*"):
-            if dir_path.is_dir() and not self.state.get_page_id(str(dir_path)):
-                # Skip hidden and system directories
-                if any(part.startswith(".") for part in dir_path.parts):
-                    continue
-                skip_folders = {
-                    "__pycache__",
-                    ".git",
-                    ".vscode",
-                    ".idea",
-                    "node_modules",
-                    ".pytest_cache",
-                }
-                if any(part in skip_folders for part in dir_path.parts):
-                    continue
-
-                title = self._get_title_from_path(dir_path)
-                proposed_titles.append(title)
+        all_dirs, md_files = self._walk_docs_dir()
+
+        # Untracked markdown files, then untracked folders
+        proposed_titles = [
+            _title_from_name(Path(path).stem)
+            for path in md_files
+            if not self.state.get_page_id(path)
+        ]
+        proposed_titles.extend(
+            _title_from_name(os.path.basename(path))
+            for path in all_dirs
+            if not self.state.get_page_id(path)
+        )
 
         # Check for conflicts (even if empty list for consistency)
         conflicts = self.confluence.check_title_conflicts(proposed_titles)
@@ -521,6 +704,9 @@ class SyncEngine:
         return self.conflict_detector.get_conflict_summary()
 
     def stop(self: "SyncEngine") -> None:
+        """Stop the worker thread, if it was started, and write pending state."""
         self._stop_event.set()
-        self._worker_thread.join()
+        if self._worker_thread is not None:
+            self._worker_thread.join()
+        self.state.close()
         logger.info("SyncEngine stopped.")
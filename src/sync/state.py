@@ -1,8 +1,12 @@
+import atexit
 import json
 import logging
+import os
 import shutil
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Iterable, Iterator, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -13,15 +17,32 @@ class SyncState:
     local files and Confluence pages.
     """
 
-    def __init__(self: "SyncState", state_file: Path) -> None:
+    def __init__(
+        self: "SyncState", state_file: Path, flush_interval: Optional[float] = None
+    ) -> None:
         """Initialize the sync state manager.
 
         Args:
             state_file: Path to the JSON file for storing state
+            flush_interval: If set, changes are written by a background thread at most
+                once per this many seconds instead of on every change. Call close()
+                to write any pending changes; they are also written at interpreter exit.
         """
         self.state_file = state_file
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self._state = self._load_state()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        self._dirty = False
+        self._batch_depth = 0
+        self.flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+            atexit.register(self.flush)
 
     def _get_default_state(self: "SyncState") -> dict:
         """Get the default empty state structure.
@@ -133,12 +154,63 @@ class SyncState:
     def _save_state(self: "SyncState") -> None:
         """Save the current state to the JSON file."""
         try:
-            with self.state_file.open("w", encoding="utf-8") as f:
-                json.dump(self._state, f, indent=2)
+            # Snapshot under the write lock too, so a concurrent save with a newer
+            # snapshot can't be overwritten by this one
+            with self._write_lock:
+                with self._lock:
+                    self._dirty = False
+                    data = json.dumps(self._state, indent=2)
+                # Write a sibling file and swap it in, so a crash mid-write can't truncate
+                # the state
+                with self._tmp_file.open("w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(self._tmp_file, self.state_file)
             logger.debug(f"Saved sync state to {self.state_file}")
         except Exception as e:
+            # Keep the changes pending so the next flush retries them
+            self._dirty = True
             logger.error(f"Failed to save state file: {e}")
 
+    def _mark_dirty(self: "SyncState") -> None:
+        """Record a state change, saving it now unless writes are batched."""
+        if self._flusher is None and not self._batch_depth:
+            self._save_state()
+        else:
+            self._dirty = True
+
+    @contextmanager
+    def batch_update(self: "SyncState") -> Iterator[None]:
+        """Defer saving until the block exits, then write all of its changes at once.
+
+        Yields:
+            None
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._flusher is None:
+                self.flush()
+
+    def _flush_loop(self: "SyncState") -> None:
+        """Background loop writing batched changes every flush_interval seconds."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self: "SyncState") -> None:
+        """Write pending changes to the state file, if there are any."""
+        if self._dirty:
+            self._save_state()
+
+    def close(self: "SyncState") -> None:
+        """Stop the background writer, if any, and write pending changes."""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            atexit.unregister(self.flush)
+        self.flush()
+
     def get_page_id(self: "SyncState", file_path: str) -> Optional[str]:
         """Get the Confluence page ID for a local file.
 
@@ -150,6 +222,18 @@ class SyncState:
         """
         return self._state["file_to_page"].get(str(file_path))
 
+    def get_page_ids(self: "SyncState", file_paths: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get the Confluence page IDs for several local files in one call.
+
+        Args:
+            file_paths: Paths to the local files
+
+        Returns:
+            Dict mapping each file path to its page ID, or None if untracked
+        """
+        file_to_page = self._state["file_to_page"]
+        return {str(path): file_to_page.get(str(path)) for path in file_paths}
+
     def get_file_path(self: "SyncState", page_id: str) -> Optional[str]:
         """Get the local file path for a Confluence page ID.
 
@@ -170,10 +254,17 @@ class SyncState:
             sync_time: Timestamp of the sync
         """
         file_path = str(file_path)  # Convert Path to string if needed
-        self._state["file_to_page"][file_path] = page_id
-        self._state["page_to_file"][page_id] = file_path
-        self._state["last_sync"][file_path] = sync_time
-        self._save_state()
+        with self._lock:
+            if (
+                self._state["file_to_page"].get(file_path) == page_id
+                and self._state["page_to_file"].get(page_id) == file_path
+                and self._state["last_sync"].get(file_path) == sync_time
+            ):
+                return
+            self._state["file_to_page"][file_path] = page_id
+            self._state["page_to_file"][page_id] = file_path
+            self._state["last_sync"][file_path] = sync_time
+        self._mark_dirty()
         logger.info(f"Added mapping: {file_path} -> {page_id}")
 
     def remove_mapping(self: "SyncState", file_path: str) -> Optional[str]:
@@ -186,12 +277,14 @@ class SyncState:
             The removed page ID if found, None otherwise
         """
         file_path = str(file_path)
-        page_id = self._state["file_to_page"].pop(file_path, None)
+        with self._lock:
+            page_id = self._state["file_to_page"].pop(file_path, None)
+            if page_id:
+                self._state["page_to_file"].pop(page_id, None)
+                self._state["last_sync"].pop(file_path, None)
+                self._state["deleted_pages"].append(page_id)
         if page_id:
-            self._state["page_to_file"].pop(page_id, None)
-            self._state["last_sync"].pop(file_path, None)
-            self._state["deleted_pages"].append(page_id)
-            self._save_state()
+            self._mark_dirty()
             logger.info(f"Removed mapping: {file_path} -> {page_id}")
         return page_id
 
@@ -214,8 +307,11 @@ class SyncState:
             sync_time: New sync timestamp
         """
         file_path = str(file_path)
-        self._state["last_sync"][file_path] = sync_time
-        self._save_state()
+        with self._lock:
+            if self._state["last_sync"].get(file_path) == sync_time:
+                return
+            self._state["last_sync"][file_path] = sync_time
+        self._mark_dirty()
         logger.debug(f"Updated sync time for {file_path}: {sync_time}")
 
     def is_page_deleted(self: "SyncState", page_id: str) -> bool:
@@ -247,6 +343,9 @@ class SyncState:
 
     def clear_deleted_pages(self: "SyncState") -> None:
         """Clear the list of deleted pages."""
-        self._state["deleted_pages"] = []
-        self._save_state()
+        with self._lock:
+            if not self._state["deleted_pages"]:
+                return
+            self._state["deleted_pages"] = []
+        self._mark_dirty()
         logger.info("Cleared deleted pages history")
@@ -3,7 +3,7 @@ import logging
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from rich.text import Text
 from textual.app import App, ComposeResult
@@ -18,6 +18,11 @@ from src.ui.widgets.conflict_widget import ConflictSummaryWidget
 
 
 CONFIG_PATH = Path("config.json")
+LOG_PATH = Path("logs/md_to_confluence.log")
+# Timestamp prefix written by the log formatter, e.g. "2024-01-01 10:00:00"
+_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+# Full log line: YYYY-MM-DD HH:MM:SS - name - LEVEL - message
+_LOG_LINE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ([^-]+) - (\w+) - (.+)$")
 
 
 class LogWidget(RichLog):
@@ -27,12 +32,13 @@ class LogWidget(RichLog):
         """Initialize the LogWidget."""
         super().__init__(max_lines=max_lines, **kwargs)
         self.session_start_time = None
+        self._session_start_prefix: Optional[Tuple[datetime, str]] = None
         self.last_file_size = 0
         self._find_session_start()
 
     def _find_session_start(self: "LogWidget") -> None:
         """Find the start time of the current session from the log file."""
-        log_file = Path("logs/md_to_confluence.log")
+        log_file = LOG_PATH
         if not log_file.exists():
             return
 
@@ -60,6 +66,20 @@ class LogWidget(RichLog):
         if not self.session_start_time:
             return True  # If we can't determine session, show all logs
 
+        # Zero-padded timestamps sort lexically, so compare the prefix as a string
+        if _TIMESTAMP_RE.fullmatch(log_line, 0, 19) and (
+            len(log_line) == 19 or log_line.startswith(" - ", 19)
+        ):
+            if (
+                self._session_start_prefix is None
+                or self._session_start_prefix[0] != self.session_start_time
+            ):
+                self._session_start_prefix = (
+                    self.session_start_time,
+                    self.session_start_time.strftime("%Y-%m-%d %H:%M:%S"),
+                )
+            return log_line[:19] >= self._session_start_prefix[1]
+
         try:
             # Extract timestamp from the log line
             timestamp_str = log_line.split(" - ")[0]
@@ -77,9 +97,7 @@ class LogWidget(RichLog):
         Returns:
             Log line with Rich markup colors applied
         """
-        # Pattern to match log format: YYYY-MM-DD HH:MM:SS - name - LEVEL - message
-        log_pattern = r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ([^-]+) - (\w+) - (.+)$"
-        match = re.match(log_pattern, log_line.strip())
+        match = _LOG_LINE_RE.match(log_line.strip())
 
         if not match:
             return log_line  # Return unchanged if pattern doesn't match
@@ -118,38 +136,42 @@ class LogWidget(RichLog):
 
     async def refresh_logs(self: "LogWidget") -> None:
         """Read new lines from the log file for the current session."""
-        log_file = Path("logs/md_to_confluence.log")
-        if not log_file.exists():
+        try:
+            current_size = LOG_PATH.stat().st_size
+        except FileNotFoundError:
             return
 
-        try:
-            current_size = log_file.stat().st_size
-            if current_size == self.last_file_size:
-                return  # No new content
+        if current_size == self.last_file_size:
+            return  # No new content
 
-            with log_file.open("r", encoding="utf-8") as f:
-                # If file is smaller than last size, it was truncated - reload all
-                if current_size < self.last_file_size:
-                    self.clear()
-                    lines = f.readlines()
-                else:
-                    # Seek to where we left off
-                    f.seek(self.last_file_size)
-                    lines = f.readlines()
-
-                # Filter and add current session lines with colors
-                for line in lines:
-                    if self._is_current_session(line.rstrip()):
-                        colored_line = self._colorize_log_line(line.rstrip())
-                        try:
-                            # Convert Rich markup to Text object for proper rendering
-                            rich_text = Text.from_markup(colored_line)
-                            self.write(rich_text)
-                        except Exception:
-                            # Fallback to plain text if markup parsing fails
-                            self.write(line.rstrip())
-
-                self.last_file_size = current_size
+        try:
+            # If file is smaller than last size, it was truncated - reload all
+            if current_size < self.last_file_size:
+                self.clear()
+                self.last_file_size = 0
+
+            # Read only the bytes appended since the last refresh
+            with LOG_PATH.open("rb") as f:
+                f.seek(self.last_file_size)
+                chunk = f.read(current_size - self.last_file_size)
+
+            # Leave a partially written last line for the next refresh
+            consumed = chunk.rfind(b"\n") + 1
+            lines = chunk[:consumed].decode("utf-8", errors="replace").splitlines()
+
+            # Filter and add current session lines with colors
+            for line in lines:
+                if self._is_current_session(line.rstrip()):
+                    colored_line = self._colorize_log_line(line.rstrip())
+                    try:
+                        # Convert Rich markup to Text object for proper rendering
+                        rich_text = Text.from_markup(colored_line)
+                        self.write(rich_text)
+                    except Exception:
+                        # Fallback to plain text if markup parsing fails
+                        self.write(line.rstrip())
+
+            self.last_file_size += consumed
 
         except Exception as e:
             logger = logging.getLogger(__name__)
@@ -157,27 +179,8 @@ class LogWidget(RichLog):
 
     async def on_mount(self: "LogWidget") -> None:
         """Load initial logs when the widget mounts."""
-        log_file = Path("logs/md_to_confluence.log")
-        if log_file.exists():
-            try:
-                with log_file.open("r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                    # Load current session lines with colors
-                    for line in lines:
-                        if self._is_current_session(line.rstrip()):
-                            colored_line = self._colorize_log_line(line.rstrip())
-                            try:
-                                # Convert Rich markup to Text object for proper rendering
-                                rich_text = Text.from_markup(colored_line)
-                                self.write(rich_text)
-                            except Exception:
-                                # Fallback to plain text if markup parsing fails
-                                self.write(line.rstrip())
-
-                    self.last_file_size = log_file.stat().st_size
-            except Exception as e:
-                logger = logging.getLogger(__name__)
-                logger.error(f"Error loading initial logs: {e}")
+        # Nothing has been read yet, so this loads the whole file
+        await self.refresh_logs()
 
 
 class MDToConfluenceApp(App):
@@ -329,10 +332,11 @@ class MDToConfluenceApp(App):
 
 def load_config(path: Path) -> Dict[str, Any]:
     """Load the config from the given path."""
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
 
 
 if __name__ == "__main__":
@@ -368,4 +372,4 @@ if __name__ == "__main__":
         app.run()
     except Exception as e:
         logger.exception(f"Fatal error in MDToConfluenceApp: {e}")
-        print(f"Fatal error: {e}. See logs/md_to_confluence.log for details.")
+        print(f"Fatal error: {e}. See {LOG_PATH} for details.")
@@ -0,0 +1,24 @@
+"""Shared pytest configuration for the md-to-confluence test suite."""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--runperf",
+        action="store_true",
+        default=False,
+        help="run slow performance tests",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runperf is given."""
+    if config.getoption("--runperf"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="use --runperf to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -0,0 +1,31 @@
+"""Helpers shared by the md-to-confluence tests."""
+
+import threading
+
+
+def wait_for_processing(engine, count=1, timeout=2.0):
+    """Install a hook on engine._process_event and return a waiter for processed events.
+
+    The engine's worker thread is started if it is not already running.
+
+    Args:
+        engine: The SyncEngine whose worker is observed
+        count: Number of processed events to wait for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        A callable that blocks until ``count`` events were processed, returning
+        False if the timeout expired first
+    """
+    process_event = engine._process_event
+    processed = threading.Semaphore(0)
+
+    def tracked(event):
+        try:
+            process_event(event)
+        finally:
+            processed.release()
+
+    engine._process_event = tracked
+    engine.start()
+    return lambda: all(processed.acquire(timeout=timeout) for _ in range(count))
@@ -304,7 +304,7 @@ class TestConfluenceClient:
         test_file = Path("test.png")
 
         # Mock the requests.post to simulate successful upload
-        with patch("requests.post") as mock_post:
+        with patch.object(client._session, "post") as mock_post:
             mock_response = Mock()
             mock_response.ok = True
             mock_response.json.return_value = {"id": "att123", "title": "test.png"}
@@ -329,7 +329,7 @@ class TestConfluenceClient:
         test_file = Path("test.png")
 
         # Mock the requests.post to return an error
-        with patch("requests.post") as mock_post:
+        with patch.object(client._session, "post") as mock_post:
             mock_response = Mock()
             mock_response.ok = False
             mock_response.status_code = 500
@@ -339,6 +339,16 @@ class TestConfluenceClient:
             result = client.upload_attachment("123", test_file)
             assert result is None  # Should return None on error
 
+    def test_session_is_per_thread(self, client):
+        """Test that each thread gets its own reused HTTP session."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            worker_session = executor.submit(lambda: client._session).result()
+
+        assert client._session is client._session
+        assert worker_session is not client._session
+
     def test_make_direct_request_get(self, client):
         """Test direct GET request."""
         mock_response = Mock()
@@ -346,7 +356,7 @@ class TestConfluenceClient:
         mock_response.json.return_value = {"success": True}
         mock_response.raise_for_status.return_value = None
 
-        with patch("requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             result = client._make_direct_request("GET", "rest/api/content/123")
@@ -361,7 +371,7 @@ class TestConfluenceClient:
         mock_response.json.return_value = {"id": "123"}
         mock_response.raise_for_status.return_value = None
 
-        with patch("requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             data = {"title": "Test Page"}
@@ -377,7 +387,7 @@ class TestConfluenceClient:
         mock_response.json.return_value = {"updated": True}
         mock_response.raise_for_status.return_value = None
 
-        with patch("requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             data = {"title": "Updated Page"}
@@ -393,7 +403,7 @@ class TestConfluenceClient:
         mock_response.json.return_value = {}
         mock_response.raise_for_status.return_value = None
 
-        with patch("requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             result = client._make_direct_request("DELETE", "rest/api/content/123")
@@ -468,7 +478,6 @@ class TestConfluenceClient:
             # Set up side effects for different calls
             mock_retry.side_effect = [
                 create_response,  # create_page call
-                {},  # list_all_space_pages call (create_page)
                 get_response,  # get_page_by_id call (update_page)
                 update_response,  # update_page call
                 True,  # delete_page call
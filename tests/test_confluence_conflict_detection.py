@@ -1,5 +1,6 @@
 """Tests for ConfluenceClient conflict detection methods."""
 
+import time
 from unittest.mock import patch
 
 import pytest
@@ -114,6 +115,56 @@ class TestConfluenceClientConflictDetection:
             expected = {"Existing Page": "12345"}
             assert conflicts == expected
 
+    def test_check_title_conflicts_loads_titles_once(self, mock_client):
+        """Test that repeated conflict checks reuse the space's page titles."""
+        with patch.object(
+            mock_client, "get_space_page_titles", return_value={"Existing Page": "12345"}
+        ) as mock_titles:
+            assert mock_client.check_title_conflicts(["Existing Page"]) == {
+                "Existing Page": "12345"
+            }
+            assert mock_client.check_title_conflicts(["New Page"]) == {}
+
+            mock_titles.assert_called_once()
+
+    def test_check_title_conflicts_reloads_expired_titles(self, mock_client):
+        """Test that the page titles are fetched again once they expire."""
+        mock_client.TITLE_INDEX_TTL = 0.0
+        with patch.object(
+            mock_client,
+            "get_space_page_titles",
+            side_effect=[{}, {"Existing Page": "12345"}],
+        ):
+            assert mock_client.check_title_conflicts(["Existing Page"]) == {}
+            time.sleep(0.001)
+            assert mock_client.check_title_conflicts(["Existing Page"]) == {
+                "Existing Page": "12345"
+            }
+
+    def test_title_index_follows_page_changes(self, mock_client):
+        """Test that created, renamed and deleted pages update the title index."""
+        with patch.object(
+            mock_client, "get_space_page_titles", return_value={"Old Title": "12345"}
+        ):
+            mock_client.refresh_title_index()
+
+        with (
+            patch.object(mock_client, "client"),
+            patch.object(mock_client, "_retry_with_backoff") as mock_retry,
+        ):
+            mock_retry.side_effect = [
+                {"id": "67890", "title": "New Page"},  # create_page
+                {"version": {"number": 1}},  # get_page_by_id (update_page)
+                {"id": "12345"},  # update_page
+                None,  # delete_page
+            ]
+            mock_client.create_page("New Page", "<p>Content</p>")
+            mock_client.update_page("12345", "Renamed Page", "<p>Content</p>")
+            mock_client.delete_page("67890")
+
+        conflicts = mock_client.check_title_conflicts(["Old Title", "New Page", "Renamed Page"])
+        assert conflicts == {"Renamed Page": "12345"}
+
     @patch("src.confluence.client.logger")
     def test_get_space_page_titles_logging(self, mock_logger, mock_client):
         """Test that appropriate logging occurs during page title retrieval."""
@@ -14,28 +14,28 @@ from src.confluence.converter import MarkdownConverter
 from src.monitor.file_watcher import FileMonitor
 from src.sync.engine import SyncEngine, SyncEvent
 from src.ui.app import MDToConfluenceApp
+from tests.helpers import wait_for_processing
 
 
 class TestComponentIntegration:
     """Test integration between core components."""
 
     @pytest.fixture
-    def temp_workspace(self):
+    def temp_workspace(self, tmp_path):
         """Create a temporary workspace for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            workspace = Path(temp_dir)
-            docs_dir = workspace / "docs"
-            logs_dir = workspace / "logs"
-            docs_dir.mkdir()
-            logs_dir.mkdir()
+        workspace = tmp_path
+        docs_dir = workspace / "docs"
+        logs_dir = workspace / "logs"
+        docs_dir.mkdir()
+        logs_dir.mkdir()
 
-            yield {
-                "workspace": workspace,
-                "docs_dir": docs_dir,
-                "logs_dir": logs_dir,
-                "state_file": workspace / "state.json",
-                "config_file": workspace / "config.json",
-            }
+        return {
+            "workspace": workspace,
+            "docs_dir": docs_dir,
+            "logs_dir": logs_dir,
+            "state_file": workspace / "state.json",
+            "config_file": workspace / "config.json",
+        }
 
     @pytest.fixture
     def mock_confluence_client(self):
@@ -130,6 +130,8 @@ def hello():
         # Create file monitor
         monitor = FileMonitor(docs_dir=temp_workspace["docs_dir"], sync_engine=sync_engine)
 
+        wait = wait_for_processing(sync_engine)
+
         # Start monitoring
         monitor.start()
 
@@ -139,7 +141,7 @@ def hello():
             test_file.write_text("# Monitor Test")
 
             # Wait for file system event and processing
-            time.sleep(0.3)
+            assert wait()
 
             # Verify file was processed (use resolved path to match SyncEvent behavior)
             page_id = sync_engine.state.get_page_id(str(test_file.resolve()))
@@ -163,41 +165,40 @@ def hello():
 
 
 @pytest.fixture
-def full_workspace():
+def full_workspace(tmp_path):
     """Create a complete workspace with all necessary files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        workspace = Path(temp_dir)
-
-        # Create directory structure
-        docs_dir = workspace / "docs"
-        logs_dir = workspace / "logs"
-        docs_dir.mkdir()
-        logs_dir.mkdir()
-
-        # Create nested structure
-        (docs_dir / "advanced").mkdir()
-        (docs_dir / "images").mkdir()
-
-        # Create config file
-        config = {
-            "confluence": {
-                "base_url": "https://test.atlassian.net",
-                "space_key": "TEST",
-                "token_op_item": "test-item",
-            },
-            "docs_dir": str(docs_dir),
-            "sync": {"debounce_interval": 1.0},
-        }
-        config_file = workspace / "config.json"
-        config_file.write_text(json.dumps(config, indent=2))
-
-        yield {
-            "workspace": workspace,
-            "docs_dir": docs_dir,
-            "logs_dir": logs_dir,
-            "config_file": config_file,
-            "state_file": workspace / "state.json",
-        }
+    workspace = tmp_path
+
+    # Create directory structure
+    docs_dir = workspace / "docs"
+    logs_dir = workspace / "logs"
+    docs_dir.mkdir()
+    logs_dir.mkdir()
+
+    # Create nested structure
+    (docs_dir / "advanced").mkdir()
+    (docs_dir / "images").mkdir()
+
+    # Create config file
+    config = {
+        "confluence": {
+            "base_url": "https://test.atlassian.net",
+            "space_key": "TEST",
+            "token_op_item": "test-item",
+        },
+        "docs_dir": str(docs_dir),
+        "sync": {"debounce_interval": 1.0},
+    }
+    config_file = workspace / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    return {
+        "workspace": workspace,
+        "docs_dir": docs_dir,
+        "logs_dir": logs_dir,
+        "config_file": config_file,
+        "state_file": workspace / "state.json",
+    }
 
 
 @pytest.fixture
@@ -403,14 +404,10 @@ And some more content.
             # Verify image upload was attempted
             sync_engine.confluence.upload_attachment.assert_called()
 
-            # Verify final content contains image macro or fallback
+            # Verify final content references the uploaded attachment
             created_page = mock_confluence_for_e2e._created_pages[page_id]
-            # Should contain either image macro or fallback info macro
-            assert (
-                'ac:name="image"' in created_page["body"]
-                or 'ac:name="info"' in created_page["body"]
-                or "![" in created_page["body"]
-            )
+            assert 'ri:filename="diagram.png"' in created_page["body"]
+            assert "LOCAL_IMAGE_" not in created_page["body"]
         finally:
             sync_engine.stop()
             SyncEngine._instance = None
@@ -436,6 +433,7 @@ And some more content.
             test_file.write_text("# Error Test\n\nThis will cause an error.")
 
             # First, cause an error during page creation
+            create_page = mock_confluence_for_e2e.create_page.side_effect
             mock_confluence_for_e2e.create_page.side_effect = Exception("Confluence error")
 
             # Process event - should handle error gracefully
@@ -447,18 +445,15 @@ And some more content.
             assert page_id is None
 
             # Restore normal behavior
-            mock_confluence_for_e2e.create_page.side_effect = None
-            mock_confluence_for_e2e.create_page.return_value = {
-                "id": "recovery123",
-                "title": "Test",
-            }
+            mock_confluence_for_e2e.create_page.side_effect = create_page
 
             # Process again - should succeed
             sync_engine._process_event(event)
 
-            # Now should be in state
+            # Now should be in state and tracked by the mock
             page_id = sync_engine.state.get_page_id(str(test_file.resolve()))
-            assert page_id == "recovery123"
+            assert page_id is not None
+            assert page_id in mock_confluence_for_e2e._created_pages
 
         finally:
             sync_engine.stop()
@@ -487,23 +482,19 @@ And some more content.
                 test_file.write_text(f"# Concurrent Test {i}\n\nContent for file {i}.")
                 files.append(test_file)
 
+            wait = wait_for_processing(sync_engine, count=len(files))
+
             # Process all events
             for test_file in files:
                 event = SyncEvent("created", test_file)
                 sync_engine.enqueue_event(event)
 
-            # Wait for processing
-            time.sleep(0.5)
+            assert wait()
 
             # Verify all files were processed
-            processed_count = 0
-            for test_file in files:
-                page_id = sync_engine.state.get_page_id(str(test_file.resolve()))
-                if page_id is not None:
-                    processed_count += 1
-
-            # Should have processed most or all files
-            assert processed_count >= 3  # Allow for some timing variations
+            page_ids = sync_engine.state.get_page_ids(str(f.resolve()) for f in files)
+            processed_count = sum(1 for page_id in page_ids.values() if page_id is not None)
+            assert processed_count == len(files)
 
         finally:
             sync_engine.stop()
@@ -622,6 +613,7 @@ class TestSystemLevelIntegration:
             # Create many files
             num_files = 20
             files = []
+            wait = wait_for_processing(sync_engine, count=num_files, timeout=30.0)
 
             start_time = time.time()
 
@@ -638,15 +630,14 @@ class TestSystemLevelIntegration:
                 sync_engine.enqueue_event(event)
 
             # Wait for all processing to complete
-            time.sleep(2.0)
+            assert wait()
 
             end_time = time.time()
             processing_time = end_time - start_time
 
             # Verify files were processed
-            processed_count = sum(
-                1 for f in files if sync_engine.state.get_page_id(str(f.resolve())) is not None
-            )
+            page_ids = sync_engine.state.get_page_ids(str(f.resolve()) for f in files)
+            processed_count = sum(1 for page_id in page_ids.values() if page_id is not None)
 
             # Performance assertions
             assert processed_count >= num_files * 0.8  # At least 80% processed
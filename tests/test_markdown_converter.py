@@ -1,7 +1,7 @@
 """Tests for MarkdownConverter."""
 
-import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -9,18 +9,47 @@ from src.confluence.converter import MarkdownConverter
 
 
 class TestMarkdownConverter:
-    """Test suite for MarkdownConverter."""
+    """Test suite for MarkdownConverter.
 
-    @pytest.fixture
+    Tests only share a per-process converter, so the module is safe to run under
+    pytest-xdist.
+    """
+
+    @pytest.fixture(scope="module")
     def converter(self):
-        """Create a MarkdownConverter instance."""
+        """Create a MarkdownConverter instance shared by the whole module."""
         return MarkdownConverter()
 
+    @pytest.fixture(scope="module")
+    def temp_root(self, tmp_path_factory):
+        """Create one temporary directory shared by the whole module."""
+        return tmp_path_factory.mktemp("converter_tests")
+
+    @pytest.fixture(scope="module")
+    def image_dir(self, temp_root):
+        """Create the image fixture files once for the whole module."""
+        images = temp_root / "images"
+        (images / "subfolder").mkdir(parents=True)
+        (images / "image1.png").write_bytes(b"fake png data")
+        (images / "subfolder" / "image2.jpg").write_bytes(b"fake jpg data")
+        (images / "document.pdf").write_bytes(b"fake pdf data")
+        (images / "test.png").write_bytes(b"fake image data")
+        return images
+
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            yield Path(tmp_dir)
+    def temp_dir(self, temp_root, request):
+        """Create a per-test subdirectory of the shared temporary directory."""
+        test_dir = temp_root / request.node.name
+        test_dir.mkdir()
+        return test_dir
+
+    def test_markdown_parser_built_lazily(self):
+        """Test that the markdown parser is only built on first use."""
+        converter = MarkdownConverter()
+
+        assert converter._md is None
+        parser = converter.md
+        assert parser is converter.md
 
     def test_basic_markdown_conversion(self, converter):
         """Test basic markdown to XHTML conversion."""
@@ -112,6 +141,26 @@ Some text after code blocks.
         assert "def hello_world():" in restored
         assert "function greet(name)" in restored
 
+    def test_code_block_unclosed_fence_left_untouched(self, converter):
+        """Test that an unclosed code fence is not extracted."""
+        markdown_content = "Intro\n\n```python\nprint('never closed')\n"
+
+        processed, code_blocks = converter._extract_code_blocks(markdown_content)
+
+        assert code_blocks == {}
+        assert processed == markdown_content
+
+    def test_restore_many_code_blocks(self, converter):
+        """Test that CODE_BLOCK_1 does not clobber the prefix of CODE_BLOCK_10."""
+        markdown_content = "\n\n".join(f"```\nblock {i}\n```" for i in range(11))
+
+        processed, code_blocks = converter._extract_code_blocks(markdown_content)
+        restored = converter._restore_code_blocks(processed, code_blocks)
+
+        assert "CODE_BLOCK_" not in restored
+        assert restored.count('ac:name="code"') == 11
+        assert "block 10" in restored
+
     def test_code_block_without_language(self, converter):
         """Test code block without specified language."""
         markdown_content = """```
@@ -124,15 +173,36 @@ no language specified
         assert len(code_blocks) == 1
         assert code_blocks["CODE_BLOCK_0"][0] == "text"  # Default language
 
-    def test_image_extraction_local_images(self, converter, temp_dir):
-        """Test extraction of local images."""
-        # Create test image files
-        img1 = temp_dir / "image1.png"
-        img2 = temp_dir / "subfolder" / "image2.jpg"
-        img2.parent.mkdir(exist_ok=True)
+    def test_extractors_skip_content_without_markers(self, converter):
+        """Test that extractors return content untouched when markers are absent."""
+        markdown_content = "# Plain\n\nNo code or images here."
+
+        assert converter._extract_code_blocks(markdown_content) == (markdown_content, {})
+        assert converter._extract_local_images(markdown_content) == (markdown_content, {})
+        assert converter._process_admonitions("<p>text</p>") == "<p>text</p>"
 
-        img1.write_bytes(b"fake png data")
-        img2.write_bytes(b"fake jpg data")
+    def test_image_title_may_contain_parenthesis(self, converter, image_dir):
+        """Test that a quoted image title may contain a closing parenthesis."""
+        markdown_content = 'See ![Alt](image1.png "Figure (1)") here.'
+
+        processed, local_images = converter._extract_local_images(markdown_content, image_dir)
+
+        assert processed == "See LOCAL_IMAGE_0 here."
+        assert local_images["LOCAL_IMAGE_0"]["title"] == "Figure (1)"
+
+    def test_unterminated_image_references_left_untouched(self, converter, image_dir):
+        """Test that unterminated image syntax is kept as-is."""
+        markdown_content = "![a](" + ' "' * 5000 + "\n![b](image1.png"
+
+        processed, local_images = converter._extract_local_images(markdown_content, image_dir)
+
+        assert processed == markdown_content
+        assert local_images == {}
+
+    def test_image_extraction_local_images(self, converter, image_dir):
+        """Test extraction of local images."""
+        img1 = image_dir / "image1.png"
+        img2 = image_dir / "subfolder" / "image2.jpg"
 
         markdown_content = """# Test Document
 
@@ -143,7 +213,7 @@ And another one: ![Another image](subfolder/image2.jpg "Image title")
 External image (should not be extracted): ![External](https://example.com/image.png)
 """
 
-        processed, local_images = converter._extract_local_images(markdown_content, temp_dir)
+        processed, local_images = converter._extract_local_images(markdown_content, image_dir)
 
         assert "LOCAL_IMAGE_0" in processed
         assert "LOCAL_IMAGE_1" in processed
@@ -165,24 +235,20 @@ External image (should not be extracted): ![External](https://example.com/image.
         # External image should remain unchanged
         assert "https://example.com/image.png" in processed
 
-    def test_image_extraction_unsupported_format(self, converter, temp_dir):
+    def test_image_extraction_unsupported_format(self, converter, image_dir):
         """Test that unsupported image formats are not extracted."""
-        # Create unsupported file
-        unsupported = temp_dir / "document.pdf"
-        unsupported.write_bytes(b"fake pdf data")
-
         markdown_content = "![PDF file](document.pdf)"
 
-        processed, local_images = converter._extract_local_images(markdown_content, temp_dir)
+        processed, local_images = converter._extract_local_images(markdown_content, image_dir)
 
         assert len(local_images) == 0
         assert "document.pdf" in processed  # Should remain unchanged
 
-    def test_image_extraction_nonexistent_file(self, converter, temp_dir):
+    def test_image_extraction_nonexistent_file(self, converter, image_dir):
         """Test handling of references to non-existent files."""
         markdown_content = "![Missing image](nonexistent.png)"
 
-        processed, local_images = converter._extract_local_images(markdown_content, temp_dir)
+        processed, local_images = converter._extract_local_images(markdown_content, image_dir)
 
         assert len(local_images) == 0
         assert "nonexistent.png" in processed  # Should remain unchanged
@@ -272,6 +338,16 @@ External image (should not be extracted): ![External](https://example.com/image.
         # Should not have an empty alt text paragraph
         assert "<p><strong>Alt text:</strong></p>" not in result
 
+    def test_create_image_fallback_escapes_markup(self, converter):
+        """Test that fallback content escapes markup in image names and alt text."""
+        image_info = {"original_name": "a&b.png", "alt": "<script>"}
+
+        result = converter._create_image_fallback(image_info)
+
+        assert "a&amp;b.png" in result
+        assert "&lt;script&gt;" in result
+        assert "<script>" not in result
+
     def test_process_admonitions(self, converter):
         """Test processing of admonition blocks."""
         content = """<div class="admonition info">
@@ -295,6 +371,12 @@ External image (should not be extracted): ![External](https://example.com/image.
         assert "This is a note block" in result
         assert "This is a warning block" in result
 
+    def test_process_admonitions_leaves_other_types(self, converter):
+        """Test that admonition types without a Confluence mapping are left unchanged."""
+        content = '<div class="admonition tip"><p>Tip</p></div>'
+
+        assert converter._process_admonitions(content) == content
+
     def test_escape_confluence_syntax(self, converter):
         """Test escaping of Confluence macro syntax in content."""
         # Test with actual macro tags that should be escaped
@@ -324,12 +406,17 @@ Also <ri:incomplete> attachment reference.
         # The method may not escape these as they don't match the pattern
         assert "incomplete" in result
 
-    def test_full_conversion_workflow(self, converter, temp_dir):
-        """Test the complete conversion workflow."""
-        # Create test image
-        img = temp_dir / "test.png"
-        img.write_bytes(b"fake image data")
+    def test_escape_confluence_syntax_documentation_macro(self, converter):
+        """Test that macro syntax used as documentation text is escaped."""
+        content = 'Use <ac:structured-macro ac:name="code">...) to add code.'
+
+        result = converter._escape_confluence_syntax(content)
+
+        assert '&lt;ac:structured-macro ac:name="code"&gt;...)' in result
+        assert "<ac:structured-macro" not in result
 
+    def test_full_conversion_workflow(self, converter, image_dir):
+        """Test the complete conversion workflow."""
         markdown_content = """# Test Document
 
 This is a test document with various elements.
@@ -362,7 +449,7 @@ And here's a numbered list:
 2. Numbered 2
 """
 
-        result = converter.convert(markdown_content, temp_dir)
+        result = converter.convert(markdown_content, image_dir)
 
         # Check that all elements are properly converted (with ID attributes)
         assert '<h1 id="test-document">Test Document</h1>' in result
@@ -372,12 +459,8 @@ And here's a numbered list:
         assert "<ul>" in result
         assert "<ol>" in result
 
-    def test_convert_with_images_workflow(self, converter, temp_dir):
+    def test_convert_with_images_workflow(self, converter, image_dir):
         """Test the two-step image conversion workflow."""
-        # Create test image
-        img = temp_dir / "test.png"
-        img.write_bytes(b"fake image data")
-
         markdown_content = """# Test Document
 
 Here's an image: ![Test image](test.png)
@@ -385,7 +468,7 @@ Here's an image: ![Test image](test.png)
 Some other content.
 """
 
-        result, local_images = converter.convert_with_images(markdown_content, temp_dir)
+        result, local_images = converter.convert_with_images(markdown_content, image_dir)
 
         # Should have placeholder in result
         assert "LOCAL_IMAGE_0" in result
@@ -411,6 +494,19 @@ Some other content.
         assert "LOCAL_IMAGE_0" not in result
         assert 'ri:filename="test.png"' in result
 
+    def test_image_workflow_renders_markdown_once(self, converter, image_dir):
+        """Test that finalizing image content does not re-run the markdown pipeline."""
+        markdown_content = "# Doc\n\n![Test image](test.png)"
+
+        with patch.object(converter.md, "convert", wraps=converter.md.convert) as md_convert:
+            content, local_images = converter.convert_with_images(markdown_content, image_dir)
+            result = converter.finalize_content_with_images(
+                content, local_images, {"LOCAL_IMAGE_0": True}
+            )
+
+        assert md_convert.call_count == 1
+        assert 'ri:filename="test.png"' in result
+
     def test_convert_file(self, converter, temp_dir):
         """Test converting markdown file to XHTML."""
         # Create test markdown file
@@ -433,6 +529,20 @@ print("Hello from file")
         assert 'ac:name="code"' in result
         assert "Hello from file" in result
 
+    def test_convert_file_skips_unchanged_files(self, converter, temp_dir):
+        """Test that unchanged files reuse the cached render and edits are picked up."""
+        md_file = temp_dir / "cached.md"
+        md_file.write_text("# First", encoding="utf-8")
+
+        with patch.object(converter.md, "convert", wraps=converter.md.convert) as md_convert:
+            first = converter.convert_file(md_file)
+            assert converter.convert_file(md_file) == first
+            assert md_convert.call_count == 1
+
+            md_file.write_text("# Second version", encoding="utf-8")
+            assert "Second version" in converter.convert_file(md_file)
+            assert md_convert.call_count == 2
+
     def test_links_conversion(self, converter):
         """Test conversion of various link types."""
         markdown_content = """Here are some links:
@@ -530,6 +640,14 @@ Term 2
         # Should contain footnote markup
         assert "footnote" in result.lower()
 
+    def test_footnotes_do_not_leak_between_documents(self, converter):
+        """Test that footnotes from one document are not rendered into the next."""
+        converter.convert("Leaky sentence[^1].\n\n[^1]: Leaked footnote.")
+
+        result = converter.convert("A document without footnotes.")
+
+        assert "Leaked footnote" not in result
+
     def test_table_of_contents(self, converter):
         """Test table of contents generation."""
         markdown_content = """[TOC]
@@ -550,6 +668,58 @@ Term 2
         assert "<h2" in result
         assert "<h3" in result
 
+    @pytest.mark.unit
+    def test_convert_memoizes_identical_content(self, converter):
+        """Test that converting the same content twice reuses the cached result."""
+        markdown_content = "# Cached\n\nSome **content**."
+
+        with patch.object(converter.md, "convert", wraps=converter.md.convert) as md_convert:
+            first = converter.convert(markdown_content)
+            second = converter.convert(markdown_content)
+
+        assert first == second
+        assert md_convert.call_count == 1
+
+    @pytest.mark.unit
+    def test_convert_cache_is_bounded(self):
+        """Test that the convert cache evicts the oldest entries past its size."""
+        converter = MarkdownConverter()
+        converter.CONVERT_CACHE_SIZE = 2
+
+        for i in range(3):
+            converter.convert(f"Paragraph {i}")
+
+        assert len(converter._convert_cache) == 2
+        assert converter._cache_key("Paragraph 0") not in converter._convert_cache
+
+    @pytest.mark.unit
+    def test_convert_cache_resolves_images_added_later(self, converter, temp_dir):
+        """Test that cached renders still resolve images created after the first conversion."""
+        markdown_content = '<img src="late.png" alt="Late image">'
+
+        with patch.object(converter.md, "convert", wraps=converter.md.convert) as md_convert:
+            first = converter.convert(markdown_content, base_path=temp_dir)
+            (temp_dir / "late.png").write_bytes(b"fake png data")
+            second = converter.convert(markdown_content, base_path=temp_dir)
+
+        assert md_convert.call_count == 1
+        assert str((temp_dir / "late.png").resolve()) not in first
+        assert str((temp_dir / "late.png").resolve()) in second
+
+    @pytest.mark.unit
+    def test_convert_with_images_sees_images_added_later(self, converter, temp_dir):
+        """Test that an image created after a first conversion is picked up."""
+        markdown_content = "![Late image](late.png)"
+
+        _, images = converter.convert_with_images(markdown_content, temp_dir)
+        assert images == {}
+
+        (temp_dir / "late.png").write_bytes(b"fake png data")
+        result, images = converter.convert_with_images(markdown_content, temp_dir)
+
+        assert "LOCAL_IMAGE_0" in result
+        assert images["LOCAL_IMAGE_0"]["filename"] == "late.png"
+
     @pytest.mark.unit
     def test_empty_content(self, converter):
         """Test conversion of empty content."""
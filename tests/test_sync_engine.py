@@ -1,51 +1,21 @@
 """Tests for SyncEngine."""
 
-import tempfile
-import threading
+import os
 import time
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from src.confluence.client import ConfluenceClient
 from src.confluence.converter import MarkdownConverter
-from src.sync.engine import SyncEngine, SyncEvent
-
-
-class TestSyncEvent:
-    """Test suite for SyncEvent."""
-
-    def test_sync_event_creation(self):
-        """Test SyncEvent creation and attributes."""
-        file_path = Path("/test/file.md")
-        event = SyncEvent("created", file_path)
-
-        assert event.event_type == "created"
-        assert event.file_path == file_path.resolve()
-        assert isinstance(event.timestamp, float)
-        assert event.timestamp > 0
-
-    def test_sync_event_repr(self):
-        """Test SyncEvent string representation."""
-        file_path = Path("/test/file.md")
-        event = SyncEvent("modified", file_path)
-
-        repr_str = repr(event)
-        assert "SyncEvent" in repr_str
-        assert "modified" in repr_str
-        assert str(file_path.resolve()) in repr_str
+from src.sync.engine import SyncEngine, SyncEvent, _title_from_name
+from tests.helpers import wait_for_processing
 
 
 class TestSyncEngine:
     """Test suite for SyncEngine."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-
     @pytest.fixture
     def mock_confluence_client(self):
         """Mock ConfluenceClient."""
@@ -54,6 +24,7 @@ class TestSyncEngine:
         mock_client.update_page.return_value = {"id": "123", "title": "Updated Page"}
         mock_client.delete_page.return_value = True
         mock_client.upload_attachment.return_value = {"id": "att123"}
+        mock_client.check_title_conflicts.return_value = {}
         return mock_client
 
     @pytest.fixture
@@ -65,11 +36,11 @@ class TestSyncEngine:
         return mock_converter
 
     @pytest.fixture
-    def sync_engine(self, temp_dir, mock_confluence_client, mock_converter):
+    def sync_engine(self, tmp_path, mock_confluence_client, mock_converter):
         """Create a SyncEngine instance for testing."""
-        docs_dir = temp_dir / "docs"
+        docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
-        state_file = temp_dir / "state.json"
+        state_file = tmp_path / "state.json"
 
         # Clear any existing instance
         SyncEngine._instance = None
@@ -80,6 +51,7 @@ class TestSyncEngine:
             confluence_client=mock_confluence_client,
             converter=mock_converter,
             debounce_interval=0.1,
+            autostart=False,
         )
 
         yield engine
@@ -88,96 +60,6 @@ class TestSyncEngine:
         engine.stop()
         SyncEngine._instance = None
 
-    def test_singleton_pattern(self, temp_dir, mock_confluence_client, mock_converter):
-        """Test that SyncEngine follows singleton pattern."""
-        docs_dir = temp_dir / "docs"
-        docs_dir.mkdir()
-        state_file = temp_dir / "state.json"
-
-        # Clear any existing instance
-        SyncEngine._instance = None
-
-        engine1 = SyncEngine.get_instance(
-            docs_dir=docs_dir,
-            state_file=state_file,
-            confluence_client=mock_confluence_client,
-            converter=mock_converter,
-        )
-
-        engine2 = SyncEngine.get_instance()
-
-        assert engine1 is engine2
-
-        engine1.stop()
-        SyncEngine._instance = None
-
-    def test_singleton_thread_safety(self, temp_dir, mock_confluence_client, mock_converter):
-        """Test singleton pattern is thread-safe."""
-        docs_dir = temp_dir / "docs"
-        docs_dir.mkdir()
-        state_file = temp_dir / "state.json"
-
-        # Clear any existing instance
-        SyncEngine._instance = None
-        instances = []
-
-        def create_engine():
-            try:
-                engine = SyncEngine.get_instance(
-                    docs_dir=docs_dir,
-                    state_file=state_file,
-                    confluence_client=mock_confluence_client,
-                    converter=mock_converter,
-                )
-                instances.append(engine)
-            except Exception:
-                pass  # Ignore errors from multiple threads
-
-        # Create multiple threads
-        threads = [threading.Thread(target=create_engine) for _ in range(5)]
-
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
-
-        # Should have at least one instance created, and all should be the same
-        assert len(instances) >= 1
-        assert len(set(instances)) == 1
-
-        instances[0].stop()
-        SyncEngine._instance = None
-
-    def test_direct_instantiation_forbidden(self, temp_dir, mock_confluence_client, mock_converter):
-        """Test that direct instantiation raises an exception when instance exists."""
-        docs_dir = temp_dir / "docs"
-        docs_dir.mkdir()
-        state_file = temp_dir / "state.json"
-
-        # Clear any existing instance
-        SyncEngine._instance = None
-
-        # Create first instance through get_instance
-        engine = SyncEngine.get_instance(
-            docs_dir=docs_dir,
-            state_file=state_file,
-            confluence_client=mock_confluence_client,
-            converter=mock_converter,
-        )
-
-        # Try direct instantiation - should raise exception
-        with pytest.raises(Exception, match="SyncEngine is a singleton"):
-            SyncEngine(
-                docs_dir=docs_dir,
-                state_file=state_file,
-                confluence_client=mock_confluence_client,
-                converter=mock_converter,
-            )
-
-        engine.stop()
-        SyncEngine._instance = None
-
     def test_enqueue_event(self, sync_engine):
         """Test event enqueueing."""
         test_file = sync_engine.docs_dir / "test.md"
@@ -186,8 +68,9 @@ class TestSyncEngine:
         event = SyncEvent("created", test_file)
         sync_engine.enqueue_event(event)
 
-        # Event should be in the queue
+        # Event should be in the queue until the worker starts
         assert not sync_engine.event_queue.empty()
+        assert wait_for_processing(sync_engine)()
 
     def test_get_relative_path_valid(self, sync_engine):
         """Test getting relative path for valid file."""
@@ -197,7 +80,27 @@ class TestSyncEngine:
 
         rel_path = sync_engine._get_relative_path(test_file)
 
-        assert rel_path == Path("subfolder/test.md")
+        assert rel_path == "subfolder/test.md"
+
+    def test_get_relative_path_sibling_with_shared_prefix(self, sync_engine):
+        """Test that a sibling directory sharing the docs_dir name prefix is rejected."""
+        sibling_file = sync_engine.docs_dir.parent / f"{sync_engine.docs_dir.name}-old" / "a.md"
+
+        assert sync_engine._get_relative_path(sibling_file) is None
+        assert sync_engine._get_relative_path(sync_engine.docs_dir) == "."
+
+    def test_get_relative_path_cached(self, sync_engine):
+        """Test that relative paths are cached and the cache stays bounded."""
+        test_file = sync_engine.docs_dir / "cached.md"
+
+        assert sync_engine._get_relative_path(test_file) == "cached.md"
+        assert test_file in sync_engine._relative_paths
+
+        with patch.object(SyncEngine, "RELATIVE_PATH_CACHE_SIZE", 2):
+            for i in range(5):
+                sync_engine._get_relative_path(sync_engine.docs_dir / f"file{i}.md")
+
+        assert len(sync_engine._relative_paths) == 2
 
     def test_get_relative_path_invalid(self, sync_engine):
         """Test getting relative path for file outside docs_dir."""
@@ -210,7 +113,7 @@ class TestSyncEngine:
 
     def test_get_parent_page_id_top_level(self, sync_engine):
         """Test getting parent page ID for top-level file."""
-        rel_path = Path("test.md")
+        rel_path = "test.md"
 
         parent_id = sync_engine._get_parent_page_id(rel_path)
 
@@ -223,71 +126,53 @@ class TestSyncEngine:
         parent_dir.mkdir()
         sync_engine.state.add_mapping(str(parent_dir), "parent123", time.time())
 
-        rel_path = Path("subfolder/test.md")
+        rel_path = "subfolder/test.md"
 
         parent_id = sync_engine._get_parent_page_id(rel_path)
 
         assert parent_id == "parent123"
 
-    def test_process_event_created_new_file(self, sync_engine):
-        """Test processing created event for new file."""
-        test_file = sync_engine.docs_dir / "new_file.md"
-        test_file.write_text("# New File")
-
-        event = SyncEvent("created", test_file)
-        sync_engine._process_event(event)
-
-        # Verify Confluence operations were called
-        sync_engine.confluence.create_page.assert_called_once()
-        sync_engine.converter.convert_with_images.assert_called_once()
-
-    def test_process_event_modified_existing_file(self, sync_engine):
-        """Test processing modified event for existing file."""
-        test_file = sync_engine.docs_dir / "existing_file.md"
-        test_file.write_text("# Existing File")
-
-        # Set up existing mapping
-        sync_engine.state.add_mapping(str(test_file), "page123", time.time())
-
-        event = SyncEvent("modified", test_file)
-        sync_engine._process_event(event)
-
-        # Verify update was called
-        sync_engine.confluence.update_page.assert_called()
-        sync_engine.converter.convert_with_images.assert_called_once()
-
-    def test_process_event_deleted_file(self, sync_engine):
-        """Test processing deleted event."""
-        test_file = sync_engine.docs_dir / "deleted_file.md"
-
-        # Set up existing mapping
-        sync_engine.state.add_mapping(str(test_file), "page123", time.time())
-
-        event = SyncEvent("deleted", test_file)
-        sync_engine._process_event(event)
-
-        # Verify delete was called
-        sync_engine.confluence.delete_page.assert_called_once_with("page123")
-
-    def test_process_event_deleted_file_no_mapping(self, sync_engine):
-        """Test processing deleted event for file with no mapping."""
-        test_file = sync_engine.docs_dir / "unmapped_file.md"
-
-        event = SyncEvent("deleted", test_file)
-        sync_engine._process_event(event)
-
-        # Delete should not be called
-        sync_engine.confluence.delete_page.assert_not_called()
-
-    def test_process_event_file_not_exists(self, sync_engine):
-        """Test processing event for non-existent file."""
-        test_file = sync_engine.docs_dir / "nonexistent.md"
-
-        event = SyncEvent("created", test_file)
-        sync_engine._process_event(event)
-
-        # Should not call create_page for non-existent file
-        sync_engine.confluence.create_page.assert_not_called()
+    @pytest.mark.parametrize(
+        "event_type, name, kind, mapped, expected_calls",
+        [
+            pytest.param("created", "new_file.md", "file", False, {"create_page": 1}, id="created"),
+            pytest.param(
+                "modified", "existing_file.md", "file", True, {"update_page": 1}, id="modified"
+            ),
+            pytest.param(
+                "deleted", "deleted_file.md", None, True, {"delete_page": 1}, id="deleted"
+            ),
+            pytest.param("deleted", "unmapped_file.md", None, False, {}, id="deleted-no-mapping"),
+            pytest.param("created", "nonexistent.md", None, False, {}, id="file-not-exists"),
+            pytest.param("created", "../outside.md", "file", False, {}, id="outside-docs-dir"),
+            pytest.param(
+                "folder_created", "existing-folder", "folder", True, {}, id="folder-already-exists"
+            ),
+            pytest.param(
+                "folder_created", "nonexistent-folder", None, False, {}, id="folder-not-exists"
+            ),
+        ],
+    )
+    def test_process_event(self, sync_engine, event_type, name, kind, mapped, expected_calls):
+        """Test which Confluence operations each kind of event triggers."""
+        path = sync_engine.docs_dir / name
+        if kind == "file":
+            path.write_text("# Test")
+        elif kind == "folder":
+            path.mkdir()
+        if mapped:
+            sync_engine.state.add_mapping(str(path.resolve()), "page123", time.time())
+
+        sync_engine._process_event(SyncEvent(event_type, path))
+
+        for method in ("create_page", "update_page", "delete_page"):
+            assert getattr(sync_engine.confluence, method).call_count == expected_calls.get(
+                method, 0
+            ), method
+        converted = 1 if {"create_page", "update_page"} & expected_calls.keys() else 0
+        assert sync_engine.converter.convert_with_images.call_count == converted
+        if event_type == "deleted" and mapped:
+            sync_engine.confluence.delete_page.assert_called_once_with("page123")
 
     def test_process_event_with_images(self, sync_engine):
         """Test processing event with local images."""
@@ -318,10 +203,45 @@ class TestSyncEngine:
 
         result = sync_engine._upload_images(page_id, local_images)
 
-        assert len(result) == 2
-        assert result["image1.png"] is True
-        assert result["image2.jpg"] is True
+        assert result == {"placeholder1": True, "placeholder2": True}
+        assert sync_engine.confluence.upload_attachment.call_count == 2
+
+    def test_upload_images_shared_file_uploaded_once(self, sync_engine):
+        """Test that an image referenced twice is uploaded once for both placeholders."""
+        image = {"path": Path("/test/image1.png"), "filename": "image1.png"}
+        local_images = {"LOCAL_IMAGE_0": image, "LOCAL_IMAGE_1": dict(image)}
+
+        result = sync_engine._upload_images("page123", local_images)
+
+        assert result == {"LOCAL_IMAGE_0": True, "LOCAL_IMAGE_1": True}
+        sync_engine.confluence.upload_attachment.assert_called_once_with(
+            "page123", Path("/test/image1.png")
+        )
+
+    def test_upload_images_same_filename_uploaded_sequentially(self, sync_engine):
+        """Test that different images sharing a filename are not uploaded concurrently."""
+        local_images = {
+            "LOCAL_IMAGE_0": {"path": Path("/test/a/diagram.png"), "filename": "diagram.png"},
+            "LOCAL_IMAGE_1": {"path": Path("/test/b/diagram.png"), "filename": "diagram.png"},
+        }
+        in_flight = []
+        overlaps = []
+
+        def upload(page_id, file_path):
+            if file_path.name in in_flight:
+                overlaps.append(file_path)
+            in_flight.append(file_path.name)
+            time.sleep(0.05)
+            in_flight.remove(file_path.name)
+            return {"id": "att123"}
+
+        sync_engine.confluence.upload_attachment.side_effect = upload
+
+        result = sync_engine._upload_images("page123", local_images)
+
+        assert result == {"LOCAL_IMAGE_0": True, "LOCAL_IMAGE_1": True}
         assert sync_engine.confluence.upload_attachment.call_count == 2
+        assert overlaps == []
 
     def test_upload_images_failure(self, sync_engine):
         """Test image upload with failures."""
@@ -335,7 +255,7 @@ class TestSyncEngine:
 
         result = sync_engine._upload_images(page_id, local_images)
 
-        assert result["image1.png"] is False
+        assert result["placeholder1"] is False
 
     def test_initial_scan(self, sync_engine):
         """Test initial scan for untracked files."""
@@ -348,12 +268,12 @@ class TestSyncEngine:
 
         # Add one file to state (already tracked)
         sync_engine.state.add_mapping(str(file1), "page123", time.time())
+        wait = wait_for_processing(sync_engine, count=2)
 
         sync_engine.initial_scan()
 
-        # Should enqueue event only for untracked file
-        # Let the worker process the queue briefly
-        time.sleep(0.2)
+        # Should enqueue events only for the untracked folder and file
+        assert wait()
 
         # Verify that create_page was called (for untracked file)
         sync_engine.confluence.create_page.assert_called()
@@ -362,6 +282,7 @@ class TestSyncEngine:
         """Test event debouncing in worker thread."""
         test_file = sync_engine.docs_dir / "debounce_test.md"
         test_file.write_text("# Test")
+        wait = wait_for_processing(sync_engine)
 
         # Enqueue multiple events quickly
         for _ in range(3):
@@ -369,11 +290,40 @@ class TestSyncEngine:
             sync_engine.enqueue_event(event)
             time.sleep(0.01)  # Small delay between events
 
-        # Wait for debounce interval + processing time
-        time.sleep(sync_engine.debounce_interval + 0.2)
+        assert wait()
+
+        # Should have coalesced the burst into a single conversion
+        assert sync_engine.converter.convert_with_images.call_count == 1
+
+    def test_debouncing_keeps_latest_event_order(self, sync_engine):
+        """Test that coalesced events are processed in order of their latest arrival."""
+        test_file = sync_engine.docs_dir / "order_test.md"
+        processed = []
+
+        with patch.object(
+            sync_engine, "_process_event", side_effect=lambda e: processed.append(e.event_type)
+        ):
+            wait = wait_for_processing(sync_engine, count=2)
+            for event_type in ("modified", "deleted", "modified"):
+                sync_engine.enqueue_event(SyncEvent(event_type, test_file))
+            assert wait()
 
-        # Should have processed events (debounced)
-        assert sync_engine.converter.convert_with_images.call_count >= 1
+        assert processed == ["deleted", "modified"]
+
+    def test_debouncing_coalesces_stale_backlog(self, sync_engine):
+        """Test that events queued while the worker was busy are merged into one batch."""
+        batches = []
+        sync_engine._check_batch_title_conflicts = lambda events: batches.append(list(events))
+        for name in ("one.md", "two.md", "one.md"):
+            sync_engine.enqueue_event(SyncEvent("modified", sync_engine.docs_dir / name))
+        # Every queued event is already past its debounce window when dequeued
+        time.sleep(sync_engine.debounce_interval * 2)
+
+        with patch.object(sync_engine, "_process_event"):
+            assert wait_for_processing(sync_engine, count=2)()
+
+        assert len(batches) == 1
+        assert [event.file_path.name for event in batches[0]] == ["two.md", "one.md"]
 
     def test_worker_thread_error_handling(self, sync_engine):
         """Test worker thread error handling."""
@@ -382,49 +332,29 @@ class TestSyncEngine:
 
         # Mock an error in processing
         sync_engine.confluence.create_page.side_effect = Exception("Processing error")
+        wait = wait_for_processing(sync_engine)
 
         event = SyncEvent("created", test_file)
         sync_engine.enqueue_event(event)
 
-        # Wait for processing
-        time.sleep(0.2)
+        assert wait()
 
         # Worker thread should continue running despite error
         assert sync_engine._worker_thread.is_alive()
 
-    def test_process_event_outside_docs_dir(self, sync_engine):
-        """Test processing event for file outside docs directory."""
-        outside_file = sync_engine.docs_dir.parent / "outside.md"
-        outside_file.write_text("# Outside")
-
-        event = SyncEvent("created", outside_file)
-        sync_engine._process_event(event)
-
-        # Should not process files outside docs_dir
-        sync_engine.confluence.create_page.assert_not_called()
-
-    def test_stop_engine(self, sync_engine):
-        """Test stopping the sync engine."""
-        assert sync_engine._worker_thread.is_alive()
-
-        sync_engine.stop()
-
-        # Worker thread should stop
-        assert not sync_engine._worker_thread.is_alive()
-
     @pytest.mark.integration
     def test_full_sync_workflow(self, sync_engine):
         """Test complete sync workflow from file creation to Confluence."""
         # Create test file
         test_file = sync_engine.docs_dir / "workflow_test.md"
         test_file.write_text("# Workflow Test\n\nThis is a test file.")
+        wait = wait_for_processing(sync_engine)
 
         # Enqueue creation event
         event = SyncEvent("created", test_file)
         sync_engine.enqueue_event(event)
 
-        # Wait for processing
-        time.sleep(0.3)
+        assert wait()
 
         # Verify complete workflow
         sync_engine.converter.convert_with_images.assert_called_once()
@@ -442,34 +372,30 @@ class TestSyncEngine:
             file_path = sync_engine.docs_dir / f"concurrent{i}.md"
             file_path.write_text(f"# Concurrent Test {i}")
             files.append(file_path)
+        wait = wait_for_processing(sync_engine, count=len(files))
 
         # Enqueue multiple events simultaneously
         for file_path in files:
             sync_engine.enqueue_event(SyncEvent("created", file_path))
 
-        # Wait for processing
-        time.sleep(0.5)
+        assert wait()
 
         # All files should be processed
         for file_path in files:
             page_id = sync_engine.state.get_page_id(str(file_path))
             assert page_id is not None
 
-    def test_get_title_from_path_file(self, sync_engine):
-        """Test title generation from file paths."""
-        file_path = sync_engine.docs_dir / "test-file_name.md"
-        file_path.touch()
-
-        title = sync_engine._get_title_from_path(file_path)
-        assert title == "Test File Name"
-
-    def test_get_title_from_path_folder(self, sync_engine):
-        """Test title generation from folder paths."""
-        folder_path = sync_engine.docs_dir / "api-documentation_v2"
-        folder_path.mkdir()
-
-        title = sync_engine._get_title_from_path(folder_path)
-        assert title == "Api Documentation V2"
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("test-file_name", "Test File Name"),
+            ("api-documentation_v2", "Api Documentation V2"),
+        ],
+        ids=["file-stem", "folder"],
+    )
+    def test_title_from_name(self, name, expected):
+        """Test title generation from file stems and folder names."""
+        assert _title_from_name(name) == expected
 
     def test_generate_folder_page_content(self, sync_engine):
         """Test folder page content generation."""
@@ -501,30 +427,6 @@ class TestSyncEngine:
         assert call_args[1]["title"] == "New Folder"
         assert "<h1>New Folder</h1>" in call_args[1]["body"]
 
-    def test_process_event_folder_created_already_exists(self, sync_engine):
-        """Test processing folder_created events when page already exists."""
-        folder_path = sync_engine.docs_dir / "existing-folder"
-        folder_path.mkdir()
-
-        # Add existing mapping
-        sync_engine.state.add_mapping(str(folder_path), "existing-page-id", time.time())
-
-        event = SyncEvent("folder_created", folder_path)
-        sync_engine._process_event(event)
-
-        # Should not create new page
-        sync_engine.confluence.create_page.assert_not_called()
-
-    def test_process_event_folder_created_not_exists(self, sync_engine):
-        """Test processing folder_created events when folder doesn't exist."""
-        folder_path = sync_engine.docs_dir / "nonexistent-folder"
-
-        event = SyncEvent("folder_created", folder_path)
-        sync_engine._process_event(event)
-
-        # Should not create page
-        sync_engine.confluence.create_page.assert_not_called()
-
     def test_delete_folder_and_children(self, sync_engine):
         """Test recursive folder deletion."""
         # Create nested structure
@@ -532,9 +434,7 @@ class TestSyncEngine:
         sub_folder = root_folder / "subfolder"
         sub_sub_folder = sub_folder / "subsubfolder"
 
-        root_folder.mkdir()
-        sub_folder.mkdir()
-        sub_sub_folder.mkdir()
+        sub_sub_folder.mkdir(parents=True)
 
         file1 = root_folder / "file1.md"
         file2 = sub_folder / "file2.md"
@@ -545,12 +445,14 @@ class TestSyncEngine:
         file3.write_text("# File 3")
 
         # Add mappings for all items
-        sync_engine.state.add_mapping(str(root_folder), "page-root", time.time())
-        sync_engine.state.add_mapping(str(sub_folder), "page-sub", time.time())
-        sync_engine.state.add_mapping(str(sub_sub_folder), "page-subsub", time.time())
-        sync_engine.state.add_mapping(str(file1), "page-file1", time.time())
-        sync_engine.state.add_mapping(str(file2), "page-file2", time.time())
-        sync_engine.state.add_mapping(str(file3), "page-file3", time.time())
+        now = time.time()
+        with sync_engine.state.batch_update():
+            sync_engine.state.add_mapping(str(root_folder), "page-root", now)
+            sync_engine.state.add_mapping(str(sub_folder), "page-sub", now)
+            sync_engine.state.add_mapping(str(sub_sub_folder), "page-subsub", now)
+            sync_engine.state.add_mapping(str(file1), "page-file1", now)
+            sync_engine.state.add_mapping(str(file2), "page-file2", now)
+            sync_engine.state.add_mapping(str(file3), "page-file3", now)
 
         # Delete root folder
         sync_engine._delete_folder_and_children(root_folder)
@@ -585,6 +487,54 @@ class TestSyncEngine:
         # Should call delete method
         sync_engine.confluence.delete_page.assert_called()
 
+    def test_initial_scan_skips_system_folders(self, sync_engine):
+        """Test that system folders are not synced while markdown inside them still is."""
+        (sync_engine.docs_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (sync_engine.docs_dir / "node_modules" / "pkg" / "README.md").write_text("# Pkg")
+        (sync_engine.docs_dir / "notes.md").mkdir()
+
+        enqueued = []
+        with patch.object(sync_engine, "enqueue_event", side_effect=enqueued.append):
+            sync_engine.initial_scan()
+
+        relative = {
+            (e.event_type, e.file_path.relative_to(sync_engine.docs_dir).as_posix())
+            for e in enqueued
+        }
+        assert relative == {
+            ("folder_created", "notes.md"),
+            ("created", "node_modules/pkg/README.md"),
+        }
+
+    def test_initial_scan_skips_unreadable_directories(self, sync_engine):
+        """Test that an unreadable directory is skipped without aborting the scan."""
+        (sync_engine.docs_dir / "locked").mkdir()
+        (sync_engine.docs_dir / "open").mkdir()
+        (sync_engine.docs_dir / "open" / "page.md").write_text("# Page")
+        scandir = os.scandir
+
+        def guarded_scandir(path):
+            if os.path.basename(path) == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        enqueued = []
+        with (
+            patch("src.sync.engine.os.scandir", side_effect=guarded_scandir),
+            patch.object(sync_engine, "enqueue_event", side_effect=enqueued.append),
+        ):
+            sync_engine.initial_scan()
+
+        relative = {
+            (e.event_type, e.file_path.relative_to(sync_engine.docs_dir).as_posix())
+            for e in enqueued
+        }
+        assert relative == {
+            ("folder_created", "locked"),
+            ("folder_created", "open"),
+            ("created", "open/page.md"),
+        }
+
     def test_initial_scan_with_folders(self, sync_engine):
         """Test initial scan includes folders."""
         # Create folder structure
@@ -606,8 +556,10 @@ class TestSyncEngine:
             return original_enqueue(event)
 
         sync_engine.enqueue_event = mock_enqueue
+        wait = wait_for_processing(sync_engine, count=3)
 
         sync_engine.initial_scan()
+        assert wait()
 
         # Should enqueue events for folders and files
         folder_events = [e for e in enqueue_calls if e.event_type == "folder_created"]
@@ -1,6 +1,5 @@
 """Tests for SyncEngine conflict detection integration."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -16,10 +15,9 @@ class TestSyncEngineConflictDetection:
     """Test conflict detection integration in SyncEngine."""
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path
 
     @pytest.fixture
     def mock_confluence_client(self):
@@ -49,6 +47,7 @@ class TestSyncEngineConflictDetection:
                 confluence_client=mock_confluence_client,
                 converter=mock_converter,
                 conflict_strategy=ConflictResolutionStrategy.SKIP,
+                autostart=False,
             )
             yield engine
             engine.stop()
@@ -90,6 +89,7 @@ class TestSyncEngineConflictDetection:
                 confluence_client=mock_confluence_client,
                 converter=mock_converter,
                 conflict_strategy=ConflictResolutionStrategy.APPEND_SUFFIX,
+                autostart=False,
             )
 
             mock_confluence_client.check_title_conflicts.return_value = {"Test Page": "12345"}
@@ -156,6 +156,7 @@ class TestSyncEngineConflictDetection:
         # Create test structure with hidden directories
         (temp_dir / ".git").mkdir()
         (temp_dir / ".git" / "config").write_text("git config")
+        (temp_dir / ".git" / "hooks").mkdir()
         (temp_dir / "__pycache__").mkdir()
         (temp_dir / "__pycache__" / "test.pyc").write_text("bytecode")
         (temp_dir / "docs").mkdir()
@@ -170,6 +171,7 @@ class TestSyncEngineConflictDetection:
         assert "Docs" in call_args
         assert "Test" in call_args
         assert ".Git" not in call_args
+        assert "Hooks" not in call_args
         assert "__Pycache__" not in call_args
 
     def test_process_event_file_creation_no_conflicts(
@@ -236,6 +238,63 @@ class TestSyncEngineConflictDetection:
         # Verify folder page was NOT created due to conflict
         mock_confluence_client.create_page.assert_not_called()
 
+    def test_batch_conflict_check_single_request(
+        self, sync_engine, temp_dir, mock_confluence_client
+    ):
+        """Test that a batch of new pages is checked for conflicts in one request."""
+        events = []
+        for name in ("first.md", "second.md"):
+            (temp_dir / name).write_text("# Content")
+            events.append(SyncEvent("created", temp_dir / name))
+
+        sync_engine._title_conflicts = sync_engine._check_batch_title_conflicts(events)
+        for event in events:
+            sync_engine._process_event(event)
+
+        mock_confluence_client.check_title_conflicts.assert_called_once_with(["First", "Second"])
+        assert mock_confluence_client.create_page.call_count == 2
+
+    def test_batch_conflict_check_sees_pages_created_in_batch(
+        self, sync_engine, temp_dir, mock_confluence_client
+    ):
+        """Test that a title created earlier in a batch conflicts with later events."""
+        events = []
+        for folder in ("one", "two"):
+            (temp_dir / folder).mkdir()
+            (temp_dir / folder / "intro.md").write_text("# Intro")
+            events.append(SyncEvent("created", temp_dir / folder / "intro.md"))
+
+        sync_engine._title_conflicts = sync_engine._check_batch_title_conflicts(events)
+        for event in events:
+            sync_engine._process_event(event)
+
+        # The second "Intro" page is skipped under the SKIP strategy
+        mock_confluence_client.create_page.assert_called_once()
+
+    def test_batch_conflict_check_allows_moved_files(
+        self, sync_engine, temp_dir, mock_confluence_client
+    ):
+        """Test that files moved within one batch are recreated, not skipped as conflicts."""
+        (temp_dir / "new").mkdir()
+        events = []
+        for page_id, name in (("111", "one.md"), ("222", "two.md")):
+            (temp_dir / "new" / name).write_text("# Content")
+            sync_engine.state.add_mapping(str(temp_dir / name), page_id, 0.0)
+            # The watcher reports a move as a deletion followed by a creation
+            events.append(SyncEvent("deleted", temp_dir / name))
+            events.append(SyncEvent("created", temp_dir / "new" / name))
+        mock_confluence_client.check_title_conflicts.return_value = {"One": "111", "Two": "222"}
+        mock_confluence_client.create_page.side_effect = [{"id": "333"}, {"id": "444"}]
+
+        sync_engine._title_conflicts = sync_engine._check_batch_title_conflicts(events)
+        for event in events:
+            sync_engine._process_event(event)
+
+        assert mock_confluence_client.delete_page.call_count == 2
+        assert mock_confluence_client.create_page.call_count == 2
+        assert sync_engine.state.get_page_id(str(temp_dir / "new" / "one.md")) == "333"
+        assert sync_engine.state.get_page_id(str(temp_dir / "new" / "two.md")) == "444"
+
     def test_get_conflict_summary(self, sync_engine):
         """Test getting conflict summary from SyncEngine."""
         # Add some mock conflicts to the detector
@@ -281,10 +340,9 @@ class TestSyncEngineConflictDetectionIntegration:
     """Integration tests for SyncEngine conflict detection."""
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path
 
     def test_full_conflict_workflow_with_append_suffix(self, temp_dir):
         """Test complete conflict detection workflow with APPEND_SUFFIX strategy."""
@@ -314,6 +372,7 @@ class TestSyncEngineConflictDetectionIntegration:
                     confluence_client=mock_client,
                     converter=mock_converter,
                     conflict_strategy=ConflictResolutionStrategy.APPEND_SUFFIX,
+                    autostart=False,
                 )
 
                 # Process events
@@ -372,6 +431,7 @@ class TestSyncEngineConflictDetectionIntegration:
                     state_file=state_file,
                     confluence_client=mock_client,
                     converter=mock_converter,
+                    autostart=False,
                 )
 
                 # Scan for conflicts
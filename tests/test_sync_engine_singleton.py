@@ -0,0 +1,158 @@
+"""Tests for the SyncEngine singleton and lifecycle."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from src.confluence.client import ConfluenceClient
+from src.confluence.converter import MarkdownConverter
+from src.sync.engine import SyncEngine
+
+
+class TestSyncEngineSingleton:
+    """Test suite for SyncEngine instance management."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for testing."""
+        return tmp_path
+
+    @pytest.fixture
+    def mock_confluence_client(self):
+        """Mock ConfluenceClient."""
+        return Mock(spec=ConfluenceClient)
+
+    @pytest.fixture
+    def mock_converter(self):
+        """Mock MarkdownConverter."""
+        return Mock(spec=MarkdownConverter)
+
+    def test_singleton_pattern(self, temp_dir, mock_confluence_client, mock_converter):
+        """Test that SyncEngine follows singleton pattern."""
+        docs_dir = temp_dir / "docs"
+        docs_dir.mkdir()
+        state_file = temp_dir / "state.json"
+
+        # Clear any existing instance
+        SyncEngine._instance = None
+
+        engine1 = SyncEngine.get_instance(
+            docs_dir=docs_dir,
+            state_file=state_file,
+            confluence_client=mock_confluence_client,
+            converter=mock_converter,
+        )
+
+        engine2 = SyncEngine.get_instance()
+
+        assert engine1 is engine2
+
+        engine1.stop()
+        SyncEngine._instance = None
+
+    def test_singleton_thread_safety(self, temp_dir, mock_confluence_client, mock_converter):
+        """Test singleton pattern is thread-safe."""
+        docs_dir = temp_dir / "docs"
+        docs_dir.mkdir()
+        state_file = temp_dir / "state.json"
+
+        # Clear any existing instance
+        SyncEngine._instance = None
+        # Release all threads together so they genuinely race on get_instance
+        barrier = threading.Barrier(5)
+
+        def create_engine(_):
+            barrier.wait()
+            return SyncEngine.get_instance(
+                docs_dir=docs_dir,
+                state_file=state_file,
+                confluence_client=mock_confluence_client,
+                converter=mock_converter,
+            )
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            instances = list(executor.map(create_engine, range(5)))
+
+        # Every thread should get the same instance without errors
+        assert len(instances) == 5
+        assert len(set(instances)) == 1
+
+        instances[0].stop()
+        SyncEngine._instance = None
+
+    def test_direct_instantiation_forbidden(self, temp_dir, mock_confluence_client, mock_converter):
+        """Test that direct instantiation raises an exception when instance exists."""
+        docs_dir = temp_dir / "docs"
+        docs_dir.mkdir()
+        state_file = temp_dir / "state.json"
+
+        # Clear any existing instance
+        SyncEngine._instance = None
+
+        # Create first instance through get_instance
+        engine = SyncEngine.get_instance(
+            docs_dir=docs_dir,
+            state_file=state_file,
+            confluence_client=mock_confluence_client,
+            converter=mock_converter,
+        )
+
+        # Try direct instantiation - should raise exception
+        with pytest.raises(Exception, match="SyncEngine is a singleton"):
+            SyncEngine(
+                docs_dir=docs_dir,
+                state_file=state_file,
+                confluence_client=mock_confluence_client,
+                converter=mock_converter,
+            )
+
+        engine.stop()
+        SyncEngine._instance = None
+
+    def test_stop_engine(self, temp_dir, mock_confluence_client, mock_converter):
+        """Test stopping the sync engine."""
+        docs_dir = temp_dir / "docs"
+        docs_dir.mkdir()
+
+        # Clear any existing instance
+        SyncEngine._instance = None
+        engine = SyncEngine.get_instance(
+            docs_dir=docs_dir,
+            state_file=temp_dir / "state.json",
+            confluence_client=mock_confluence_client,
+            converter=mock_converter,
+        )
+        assert engine._worker_thread.is_alive()
+
+        engine.stop()
+        SyncEngine._instance = None
+
+        # Worker thread should stop
+        assert not engine._worker_thread.is_alive()
+
+    def test_deferred_start(self, temp_dir, mock_confluence_client, mock_converter):
+        """Test that autostart=False defers the worker thread until start()."""
+        docs_dir = temp_dir / "docs"
+        docs_dir.mkdir()
+
+        SyncEngine._instance = None
+        engine = SyncEngine.get_instance(
+            docs_dir=docs_dir,
+            state_file=temp_dir / "state.json",
+            confluence_client=mock_confluence_client,
+            converter=mock_converter,
+            autostart=False,
+        )
+        assert engine._worker_thread is None
+
+        engine.start()
+        worker_thread = engine._worker_thread
+        engine.start()
+        assert engine._worker_thread is worker_thread
+        assert worker_thread.is_alive()
+
+        engine.stop()
+        SyncEngine._instance = None
+        assert not worker_thread.is_alive()
@@ -0,0 +1,40 @@
+"""Tests for SyncEvent."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from src.sync.engine import SyncEvent
+
+
+class TestSyncEvent:
+    """Test suite for SyncEvent."""
+
+    def test_sync_event_creation(self):
+        """Test SyncEvent creation and attributes."""
+        file_path = Path("/test/file.md")
+        event = SyncEvent("created", file_path)
+
+        assert event.event_type == "created"
+        assert event.file_path == Path(os.path.realpath(file_path))
+        assert isinstance(event.timestamp, int)
+        assert event.timestamp > 0
+
+    def test_sync_event_resolves_each_path_once(self):
+        """Test that repeated events for one path share a single resolution."""
+        file_path = Path("/test/burst.md")
+        with patch("src.sync.engine.os.path.realpath", wraps=os.path.realpath) as realpath:
+            events = [SyncEvent("modified", file_path) for _ in range(5)]
+
+        assert realpath.call_count <= 1
+        assert all(event.file_path == events[0].file_path for event in events)
+
+    def test_sync_event_repr(self):
+        """Test SyncEvent string representation."""
+        file_path = Path("/test/file.md")
+        event = SyncEvent("modified", file_path)
+
+        repr_str = repr(event)
+        assert "SyncEvent" in repr_str
+        assert "modified" in repr_str
+        assert str(file_path.resolve()) in repr_str
@@ -1,7 +1,8 @@
 """Tests for SyncState."""
 
 import json
-import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -14,14 +15,11 @@ class TestSyncState:
     """Test suite for SyncState."""
 
     @pytest.fixture
-    def temp_state_file(self):
+    def temp_state_file(self, tmp_path):
         """Create a temporary state file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
-        yield temp_path
-        # Clean up
-        if temp_path.exists():
-            temp_path.unlink()
+        temp_path = tmp_path / "state.json"
+        temp_path.touch()
+        return temp_path
 
     @pytest.fixture
     def state(self, temp_state_file):
@@ -186,6 +184,18 @@ class TestSyncState:
         with patch("builtins.open", side_effect=PermissionError("Permission denied")):
             state._save_state()  # Should not raise exception
 
+    def test_failed_save_keeps_changes_pending(self, temp_state_file):
+        """Test that a failed write leaves the state dirty so the next flush retries it."""
+        state = SyncState(temp_state_file, flush_interval=60)
+        state.add_mapping("test.md", "123", 1234567890.0)
+
+        with patch("src.sync.state.os.replace", side_effect=OSError("No space left")):
+            state.flush()
+        assert state._dirty
+
+        state.close()
+        assert json.loads(temp_state_file.read_text())["file_to_page"] == {"test.md": "123"}
+
     def test_get_page_id(self, state):
         """Test getting page ID for file path."""
         state._state["file_to_page"]["test.md"] = "123"
@@ -193,6 +203,15 @@ class TestSyncState:
         assert state.get_page_id("test.md") == "123"
         assert state.get_page_id("nonexistent.md") is None
 
+    def test_get_page_ids(self, state):
+        """Test getting page IDs for several file paths at once."""
+        state._state["file_to_page"]["a.md"] = "1"
+        state._state["file_to_page"]["b.md"] = "2"
+
+        result = state.get_page_ids(["a.md", Path("b.md"), "missing.md"])
+
+        assert result == {"a.md": "1", "b.md": "2", "missing.md": None}
+
     def test_get_file_path(self, state):
         """Test getting file path for page ID."""
         state._state["page_to_file"]["123"] = "test.md"
@@ -210,6 +229,117 @@ class TestSyncState:
         assert state._state["last_sync"]["test.md"] == 1234567890.0
         mock_save.assert_called_once()
 
+    def test_batched_writes_deferred_until_close(self, temp_state_file):
+        """Test that a flush interval batches changes into one write on close."""
+        state = SyncState(temp_state_file, flush_interval=60)
+
+        with patch.object(state, "_save_state", wraps=state._save_state) as mock_save:
+            for i in range(10):
+                state.add_mapping(f"file{i}.md", str(i), 1234567890.0)
+            assert mock_save.call_count == 0
+
+            state.close()
+            mock_save.assert_called_once()
+
+        with open(temp_state_file) as f:
+            assert len(json.load(f)["file_to_page"]) == 10
+
+    def test_batched_writes_flushed_periodically(self, temp_state_file):
+        """Test that the background writer persists batched changes."""
+        state = SyncState(temp_state_file, flush_interval=0.01)
+        state.add_mapping("test.md", "123", 1234567890.0)
+
+        for _ in range(200):
+            if not state._dirty:
+                break
+            time.sleep(0.01)
+
+        with open(temp_state_file) as f:
+            assert json.load(f)["file_to_page"] == {"test.md": "123"}
+        state.close()
+
+    def test_batched_writes_flushed_at_exit(self, temp_state_file):
+        """Test that batched state registers an exit hook until it is closed."""
+        with patch("src.sync.state.atexit") as mock_atexit:
+            state = SyncState(temp_state_file, flush_interval=60)
+            mock_atexit.register.assert_called_once_with(state.flush)
+
+            state.close()
+            mock_atexit.unregister.assert_called_once_with(state.flush)
+
+    def test_save_state_replaces_file(self, state):
+        """Test that saving swaps in a fully written file and leaves no temp file."""
+        state.add_mapping("test.md", "123", 1234567890.0)
+
+        assert json.loads(state.state_file.read_text())["file_to_page"] == {"test.md": "123"}
+        assert not state._tmp_file.exists()
+
+    def test_save_state_interrupted_keeps_previous_file(self, state):
+        """Test that a save failing before the swap leaves the previous state intact."""
+        state.add_mapping("first.md", "1", 1234567890.0)
+
+        with patch("src.sync.state.os.replace", side_effect=OSError("Interrupted")):
+            state.add_mapping("second.md", "2", 1234567890.0)
+
+        assert json.loads(state.state_file.read_text())["file_to_page"] == {"first.md": "1"}
+
+    def test_concurrent_saves_keep_newest_snapshot(self, temp_state_file):
+        """Test that a save racing an in-progress save cannot leave older state on disk."""
+        state = SyncState(temp_state_file, flush_interval=60)
+        state.add_mapping("first.md", "1", 1234567890.0)
+        write_lock = state._write_lock
+        racing = []
+
+        class RacingLock:
+            """Run a second save just before the first save takes the write lock."""
+
+            def __enter__(self):
+                if not racing:
+                    racing.append(True)
+                    state.add_mapping("second.md", "2", 1234567890.0)
+                    second_save = threading.Thread(target=state.flush)
+                    second_save.start()
+                    second_save.join()
+                write_lock.acquire()
+
+            def __exit__(self, *exc_info):
+                write_lock.release()
+
+        state._write_lock = RacingLock()
+        state.flush()
+
+        assert json.loads(temp_state_file.read_text())["file_to_page"] == {
+            "first.md": "1",
+            "second.md": "2",
+        }
+        state.close()
+
+    def test_batch_update_saves_once(self, state):
+        """Test that changes inside batch_update are written in a single save."""
+        with patch.object(state, "_save_state", wraps=state._save_state) as mock_save:
+            with state.batch_update():
+                for i in range(5):
+                    state.add_mapping(f"file{i}.md", str(i), 1234567890.0)
+                with state.batch_update():
+                    state.remove_mapping("file0.md")
+                assert mock_save.call_count == 0
+            mock_save.assert_called_once()
+
+        assert len(state.get_all_tracked_files()) == 4
+
+    def test_unchanged_updates_skip_save(self, state):
+        """Test that re-recording identical values does not rewrite the state file."""
+        state.add_mapping("test.md", "123", 1234567890.0)
+
+        with patch.object(state, "_save_state") as mock_save:
+            state.add_mapping("test.md", "123", 1234567890.0)
+            state.update_sync_time("test.md", 1234567890.0)
+            state.clear_deleted_pages()
+            mock_save.assert_not_called()
+
+            state.update_sync_time("test.md", 1234567891.0)
+            mock_save.assert_called_once()
+
     def test_add_mapping_path_object(self, state):
         """Test adding mapping with Path object."""
         file_path = Path("test.md")
@@ -1,7 +1,7 @@
 """Tests for UI components."""
 
 import json
-import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -15,18 +15,17 @@ from src.ui.app import LogWidget, MDToConfluenceApp, load_config
 class TestLogWidget:
     """Test suite for LogWidget."""
 
-    def test_log_widget_initialization(self):
+    def test_log_widget_initialization(self, tmp_path, monkeypatch):
         """Test LogWidget initialization."""
 
-        # Mock the log file path to prevent reading real log files
-        with patch("src.ui.app.Path") as mock_path:
-            mock_path.return_value.exists.return_value = False
+        # Point the widget at a missing log file to avoid reading the real one
+        monkeypatch.setattr("src.ui.app.LOG_PATH", tmp_path / "missing.log")
 
-            widget = LogWidget(max_lines=500)
+        widget = LogWidget(max_lines=500)
 
-            assert widget.max_lines == 500
-            assert widget.session_start_time is None
-            assert widget.last_file_size == 0
+        assert widget.max_lines == 500
+        assert widget.session_start_time is None
+        assert widget.last_file_size == 0
 
     def test_add_log_message(self):
         """Test adding log messages to widget."""
@@ -113,164 +112,137 @@ class TestLogWidget:
         # Should return unchanged if format doesn't match
         assert colored == invalid_line
 
-    def test_is_current_session_no_session_time(self):
-        """Test session checking when no session time is set."""
+    @pytest.mark.parametrize(
+        "session_start, log_line, expected",
+        [
+            (None, "2024-01-01 10:00:00 - INFO - Test message", True),
+            (datetime(2024, 1, 1, 9, 0, 0), "2024-01-01 10:00:00 - INFO - Test message", True),
+            (datetime(2024, 1, 1, 9, 0, 0), "2024-01-01 08:00:00 - INFO - Old message", False),
+            (datetime(2024, 1, 1, 9, 0, 0), "Invalid log format", True),
+        ],
+        ids=["no-session-time", "after-session-start", "before-session-start", "invalid-format"],
+    )
+    def test_is_current_session(self, session_start, log_line, expected):
+        """Test which log lines are treated as part of the current session."""
         widget = LogWidget()
-        widget.session_start_time = None
-
-        result = widget._is_current_session("2024-01-01 10:00:00 - INFO - Test message")
+        widget.session_start_time = session_start
 
-        assert result is True
+        assert widget._is_current_session(log_line) is expected
 
-    def test_is_current_session_valid_format(self):
-        """Test session checking with valid log format."""
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_refresh_logs_no_file(self):
+        """Test refreshing logs when log file doesn't exist."""
         widget = LogWidget()
 
-        # Set session start time
-        from datetime import datetime
-
-        widget.session_start_time = datetime(2024, 1, 1, 9, 0, 0)
-
-        # Test message after session start
-        result = widget._is_current_session("2024-01-01 10:00:00 - INFO - Test message")
-        assert result is True
-
-        # Test message before session start
-        result = widget._is_current_session("2024-01-01 08:00:00 - INFO - Old message")
-        assert result is False
+        # Should not raise exception
+        await widget.refresh_logs()
 
-    def test_is_current_session_invalid_format(self):
-        """Test session checking with invalid log format."""
-        widget = LogWidget()
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_refresh_logs_with_file(self, tmp_path, monkeypatch):
+        """Test refreshing logs with existing log file."""
 
-        from datetime import datetime
+        log_file = tmp_path / "md_to_confluence.log"
 
-        widget.session_start_time = datetime(2024, 1, 1, 9, 0, 0)
+        # Create log file with content in the correct format
+        log_content = "2024-01-01 10:00:00 - test - INFO - Test message\n"
+        log_file.write_text(log_content)
 
-        # Test invalid format - should return True
-        result = widget._is_current_session("Invalid log format")
-        assert result is True
+        # Point the widget at our temporary log file
+        monkeypatch.setattr("src.ui.app.LOG_PATH", log_file)
 
-    @pytest.mark.asyncio
-    async def test_refresh_logs_no_file(self):
-        """Test refreshing logs when log file doesn't exist."""
         widget = LogWidget()
+        # Set session_start_time to None so all logs are included
+        widget.session_start_time = None
+        # Mock write method to track calls
+        widget.write = Mock()
 
-        # Should not raise exception
         await widget.refresh_logs()
 
-    @pytest.mark.asyncio
-    async def test_refresh_logs_with_file(self):
-        """Test refreshing logs with existing log file."""
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "md_to_confluence.log"
+        # Should have called write at least once
+        assert widget.write.call_count >= 1
 
-            # Create log file with content in the correct format
-            log_content = "2024-01-01 10:00:00 - test - INFO - Test message\n"
-            log_file.write_text(log_content)
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_refresh_logs_file_truncated(self, tmp_path, monkeypatch):
+        """Test refreshing logs when file was truncated."""
+        log_file = tmp_path / "md_to_confluence.log"
 
-            # Mock the Path to point to our temporary file
-            with patch("src.ui.app.Path") as mock_path:
-                mock_path.return_value = log_file
-                mock_path.side_effect = lambda x: (
-                    Path(x) if x != "logs/md_to_confluence.log" else log_file
-                )
+        widget = LogWidget()
+        widget.last_file_size = 1000  # Larger than actual file
 
-                widget = LogWidget()
-                # Set session_start_time to None so all logs are included
-                widget.session_start_time = None
-                # Mock write method to track calls
-                widget.write = Mock()
+        # Create smaller log file
+        log_content = "2024-01-01 10:00:00 - INFO - New content\n"
+        log_file.write_text(log_content)
 
-                await widget.refresh_logs()
+        monkeypatch.setattr("src.ui.app.LOG_PATH", log_file)
 
-                # Should have called write at least once
-                assert widget.write.call_count >= 1
+        widget.clear = Mock()
+        widget.write = Mock()
 
-    @pytest.mark.asyncio
-    async def test_refresh_logs_file_truncated(self):
-        """Test refreshing logs when file was truncated."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "md_to_confluence.log"
+        await widget.refresh_logs()
 
-            widget = LogWidget()
-            widget.last_file_size = 1000  # Larger than actual file
+        # Should have cleared and reloaded
+        widget.clear.assert_called_once()
 
-            # Create smaller log file
-            log_content = "2024-01-01 10:00:00 - INFO - New content\n"
-            log_file.write_text(log_content)
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_refresh_logs_reads_only_complete_new_lines(self, tmp_path, monkeypatch):
+        """Test that refreshing reads appended lines once and waits for partial ones."""
+        log_file = tmp_path / "md_to_confluence.log"
+        log_file.write_text("2024-01-01 10:00:00 - test - INFO - First\n2024-01-01 10:00:01")
+        monkeypatch.setattr("src.ui.app.LOG_PATH", log_file)
 
-            with patch("src.ui.app.Path") as mock_path:
-                mock_path.return_value = log_file
-                mock_path.side_effect = lambda x: (
-                    Path(x) if x != "logs/md_to_confluence.log" else log_file
-                )
+        widget = LogWidget()
+        widget.write = Mock()
 
-                widget.clear = Mock()
-                widget.write = Mock()
+        await widget.refresh_logs()
+        assert widget.write.call_count == 1
 
-                await widget.refresh_logs()
+        with log_file.open("a") as f:
+            f.write(" - test - INFO - Second\n")
+        await widget.refresh_logs()
 
-                # Should have cleared and reloaded
-                widget.clear.assert_called_once()
+        assert widget.write.call_count == 2
+        assert "Second" in str(widget.write.call_args[0][0])
+        assert widget.last_file_size == log_file.stat().st_size
 
-    @pytest.mark.asyncio
-    async def test_on_mount_with_log_file(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_on_mount_with_log_file(self, tmp_path, monkeypatch):
         """Test widget mounting with existing log file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "md_to_confluence.log"
-            log_content = "2024-01-01 10:00:00 - INFO - Initial message\n"
-            log_file.write_text(log_content)
+        log_file = tmp_path / "md_to_confluence.log"
+        log_content = "2024-01-01 10:00:00 - INFO - Initial message\n"
+        log_file.write_text(log_content)
 
-            widget = LogWidget()
+        widget = LogWidget()
 
-            with patch("src.ui.app.Path") as mock_path:
-                mock_path.return_value = log_file
-                mock_path.side_effect = lambda x: (
-                    Path(x) if x != "logs/md_to_confluence.log" else log_file
-                )
+        monkeypatch.setattr("src.ui.app.LOG_PATH", log_file)
 
-                widget.write = Mock()
+        widget.write = Mock()
 
-                await widget.on_mount()
+        await widget.on_mount()
 
-                # Should have loaded initial content
-                assert widget.last_file_size > 0
+        # Should have loaded initial content
+        assert widget.last_file_size > 0
 
-    def test_find_session_start_no_file(self):
+    def test_find_session_start_no_file(self, tmp_path, monkeypatch):
         """Test finding session start when no log file exists."""
-        from unittest.mock import patch
+        monkeypatch.setattr("src.ui.app.LOG_PATH", tmp_path / "missing.log")
 
-        with patch("src.ui.app.Path") as mock_path:
-            mock_path.return_value.exists.return_value = False
-
-            widget = LogWidget()
-            widget._find_session_start()
+        widget = LogWidget()
+        widget._find_session_start()
 
-            assert widget.session_start_time is None
+        assert widget.session_start_time is None
 
-    def test_find_session_start_with_session_marker(self):
+    def test_find_session_start_with_session_marker(self, tmp_path, monkeypatch):
         """Test finding session start with session marker in log."""
-        from unittest.mock import patch
+        log_file = tmp_path / "md_to_confluence.log"
+        log_content = "2024-01-01 10:00:00 - INFO - New session started at 2024-01-01 10:00:00\n"
+        log_file.write_text(log_content)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "md_to_confluence.log"
-            log_content = (
-                "2024-01-01 10:00:00 - INFO - New session started at 2024-01-01 10:00:00\n"
-            )
-            log_file.write_text(log_content)
+        monkeypatch.setattr("src.ui.app.LOG_PATH", log_file)
 
-            with patch("src.ui.app.Path") as mock_path:
-                mock_path.return_value = log_file
-                mock_path.side_effect = lambda x: (
-                    Path(x) if x != "logs/md_to_confluence.log" else log_file
-                )
-
-                widget = LogWidget()
-                widget._find_session_start()
+        widget = LogWidget()
+        widget._find_session_start()
 
-                assert widget.session_start_time is not None
+        assert widget.session_start_time is not None
 
 
 class TestMDToConfluenceApp:
@@ -315,7 +287,7 @@ class TestMDToConfluenceApp:
         # Should be a generator/iterator
         assert hasattr(compose_result, "__iter__")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_on_mount(self, app):
         """Test app mounting behavior."""
         # Mock the data table and set interval methods
@@ -331,7 +303,7 @@ class TestMDToConfluenceApp:
             # Should set up intervals (file status, log refresh, conflict summary)
             assert app.set_interval.call_count == 3
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_refresh_file_statuses(self, app):
         """Test refreshing file statuses."""
         app.data_table.clear = Mock()
@@ -355,77 +327,42 @@ class TestMDToConfluenceApp:
 
         app.log_widget.clear.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_refresh_conflict_summary_no_conflicts(self, app):
-        """Test refresh conflict summary when no conflicts exist."""
-        # Mock get_conflict_summary to return empty dict
-        app.sync_engine.get_conflict_summary.return_value = {}
-
-        # Mock widget visibility state
-        app.conflict_widget_visible = False
-        app._hide_conflict_widget = AsyncMock()
-        app._show_conflict_widget = AsyncMock()
-
-        await app.refresh_conflict_summary()
-
-        # Should not show widget when no conflicts
-        app._show_conflict_widget.assert_not_called()
-        app._hide_conflict_widget.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_refresh_conflict_summary_with_conflicts_show_widget(self, app):
-        """Test refresh conflict summary when conflicts exist and widget is hidden."""
-        # Mock get_conflict_summary to return conflicts
-        app.sync_engine.get_conflict_summary.return_value = {"title_conflict": 2}
-
-        # Mock widget state - not visible
-        app.conflict_widget_visible = False
-        app._show_conflict_widget = AsyncMock()
-        app.conflict_widget.update_summary = Mock()
-
-        await app.refresh_conflict_summary()
-
-        # Should show widget and update summary
-        app._show_conflict_widget.assert_called_once()
-        app.conflict_widget.update_summary.assert_called_once_with({"title_conflict": 2})
-
-    @pytest.mark.asyncio
-    async def test_refresh_conflict_summary_conflicts_resolved_hide_widget(self, app):
-        """Test refresh conflict summary when conflicts are resolved and widget is visible."""
-        # Mock get_conflict_summary to return no conflicts
-        app.sync_engine.get_conflict_summary.return_value = {}
-
-        # Mock widget state - visible
-        app.conflict_widget_visible = True
-        app._hide_conflict_widget = AsyncMock()
-        app._show_conflict_widget = AsyncMock()
-
-        await app.refresh_conflict_summary()
-
-        # Should hide widget when conflicts are resolved
-        app._hide_conflict_widget.assert_called_once()
-        app._show_conflict_widget.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_refresh_conflict_summary_update_existing_widget(self, app):
-        """Test refresh conflict summary when conflicts exist and widget is already visible."""
-        # Mock get_conflict_summary to return conflicts
-        app.sync_engine.get_conflict_summary.return_value = {"title_conflict": 1}
-
-        # Mock widget state - already visible
-        app.conflict_widget_visible = True
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "summary, was_visible, expect_show, expect_hide",
+        [
+            ({}, False, False, False),
+            ({"title_conflict": 2}, False, True, False),
+            ({}, True, False, True),
+            ({"title_conflict": 1}, True, False, False),
+        ],
+        ids=[
+            "no-conflicts",
+            "conflicts-show-widget",
+            "conflicts-resolved-hide-widget",
+            "update-existing-widget",
+        ],
+    )
+    async def test_refresh_conflict_summary(
+        self, app, summary, was_visible, expect_show, expect_hide
+    ):
+        """Test that refreshing the conflict summary shows, hides or updates the widget."""
+        app.sync_engine.get_conflict_summary.return_value = summary
+        app.conflict_widget_visible = was_visible
         app._show_conflict_widget = AsyncMock()
         app._hide_conflict_widget = AsyncMock()
         app.conflict_widget.update_summary = Mock()
 
         await app.refresh_conflict_summary()
 
-        # Should only update the existing widget
-        app._show_conflict_widget.assert_not_called()
-        app._hide_conflict_widget.assert_not_called()
-        app.conflict_widget.update_summary.assert_called_once_with({"title_conflict": 1})
+        assert app._show_conflict_widget.called is expect_show
+        assert app._hide_conflict_widget.called is expect_hide
+        if summary:
+            app.conflict_widget.update_summary.assert_called_once_with(summary)
+        else:
+            app.conflict_widget.update_summary.assert_not_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_show_conflict_widget(self, app):
         """Test showing the conflict widget."""
         # Mock the container structure
@@ -442,7 +379,7 @@ class TestMDToConfluenceApp:
         mock_vertical.mount.assert_called_once_with(app.conflict_widget, before=app.data_table)
         assert app.conflict_widget_visible is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_hide_conflict_widget(self, app):
         """Test hiding the conflict widget."""
         app.conflict_widget.remove = AsyncMock()
@@ -454,7 +391,7 @@ class TestMDToConfluenceApp:
         app.conflict_widget.remove.assert_called_once()
         assert app.conflict_widget_visible is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_show_conflict_widget_no_container(self, app):
         """Test showing conflict widget when main container is not set."""
         app.main_container = None
@@ -465,7 +402,7 @@ class TestMDToConfluenceApp:
         # Should not change visibility when container is not available
         assert app.conflict_widget_visible is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_hide_conflict_widget_already_hidden(self, app):
         """Test hiding conflict widget when it's already hidden."""
         app.conflict_widget.remove = AsyncMock()
@@ -477,7 +414,7 @@ class TestMDToConfluenceApp:
         app.conflict_widget.remove.assert_not_called()
         assert app.conflict_widget_visible is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_app_with_pilot(self, app):
         """Test app interaction using Textual pilot."""
         async with app.run_test() as pilot:
@@ -492,21 +429,20 @@ class TestMDToConfluenceApp:
 class TestLoadConfig:
     """Test suite for load_config function."""
 
-    def test_load_config_success(self):
+    def test_load_config_success(self, tmp_path):
         """Test successful config loading."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "config.json"
-            config_data = {
-                "confluence": {"base_url": "https://test.atlassian.net", "space_key": "TEST"},
-                "docs_dir": "docs",
-                "sync": {"debounce_interval": 2.0},
-            }
+        config_file = tmp_path / "config.json"
+        config_data = {
+            "confluence": {"base_url": "https://test.atlassian.net", "space_key": "TEST"},
+            "docs_dir": "docs",
+            "sync": {"debounce_interval": 2.0},
+        }
 
-            config_file.write_text(json.dumps(config_data))
+        config_file.write_text(json.dumps(config_data))
 
-            result = load_config(config_file)
+        result = load_config(config_file)
 
-            assert result == config_data
+        assert result == config_data
 
     def test_load_config_file_not_found(self):
         """Test config loading when file doesn't exist."""
@@ -515,21 +451,20 @@ class TestLoadConfig:
         with pytest.raises(FileNotFoundError):
             load_config(non_existent_file)
 
-    def test_load_config_invalid_json(self):
+    def test_load_config_invalid_json(self, tmp_path):
         """Test config loading with invalid JSON."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "config.json"
-            config_file.write_text("{ invalid json ")
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{ invalid json ")
 
-            with pytest.raises(json.JSONDecodeError):
-                load_config(config_file)
+        with pytest.raises(json.JSONDecodeError):
+            load_config(config_file)
 
 
 class TestUIIntegration:
     """Integration tests for UI components."""
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_full_app_workflow(self):
         """Test complete app workflow."""
         # Create mock sync engine with realistic behavior
@@ -554,45 +489,40 @@ class TestUIIntegration:
             await pilot.press("q")
 
     @pytest.mark.integration
-    def test_log_widget_with_real_content(self):
+    def test_log_widget_with_real_content(self, tmp_path, monkeypatch):
         """Test LogWidget with realistic log content."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "md_to_confluence.log"
+        log_file = tmp_path / "md_to_confluence.log"
 
-            # Create realistic log content
-            log_content = """2024-01-01 10:00:00 - INFO - MD-to-Confluence started
+        # Create realistic log content
+        log_content = """2024-01-01 10:00:00 - INFO - MD-to-Confluence started
 2024-01-01 10:00:01 - INFO - New session started at 2024-01-01 10:00:00
 2024-01-01 10:00:02 - DEBUG - Scanning docs directory
 2024-01-01 10:00:03 - INFO - Found 5 markdown files
 2024-01-01 10:00:04 - INFO - Processing file: getting-started.md
 2024-01-01 10:00:05 - INFO - Created page with ID: 123456
 """
-            log_file.write_text(log_content)
+        log_file.write_text(log_content)
 
-            widget = LogWidget()
+        widget = LogWidget()
 
-            with patch("src.ui.app.Path") as mock_path:
-                mock_path.return_value = log_file
-                mock_path.side_effect = lambda x: (
-                    Path(x) if x != "logs/md_to_confluence.log" else log_file
-                )
+        monkeypatch.setattr("src.ui.app.LOG_PATH", log_file)
 
-                # Find session start
-                widget._find_session_start()
+        # Find session start
+        widget._find_session_start()
 
-                # Should have found session start time
-                assert widget.session_start_time is not None
+        # Should have found session start time
+        assert widget.session_start_time is not None
 
-                # Test session filtering
-                session_lines = [
-                    "2024-01-01 10:00:02 - DEBUG - Scanning docs directory",
-                    "2024-01-01 09:59:59 - INFO - Old message",  # Before session
-                ]
+        # Test session filtering
+        session_lines = [
+            "2024-01-01 10:00:02 - DEBUG - Scanning docs directory",
+            "2024-01-01 09:59:59 - INFO - Old message",  # Before session
+        ]
 
-                assert widget._is_current_session(session_lines[0]) is True
-                assert widget._is_current_session(session_lines[1]) is False
+        assert widget._is_current_session(session_lines[0]) is True
+        assert widget._is_current_session(session_lines[1]) is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_app_error_handling(self):
         """Test app error handling scenarios."""
         # Create mock engine that raises exceptions